@@ -1,26 +1,86 @@
+import asyncio
 import json
-from typing import Any, Dict, Iterable, List, Union
-
-from stream_chat.base.channel import ChannelInterface, add_user_id
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    TypeVar,
+    Union,
+)
+
+from stream_chat.base.channel import (
+    ChannelInterface,
+    ReadCacheMixin,
+    add_user_id,
+    add_user_id_inplace,
+    member_changes_payload,
+    normalize_unset,
+    to_sequence,
+)
+from stream_chat.base.client import StreamChatInterface
 from stream_chat.base.exceptions import StreamChannelException
 from stream_chat.types.stream_response import StreamResponse
 
+T = TypeVar("T")
+
+
+async def gather_limited(awaitables: Iterable[Awaitable[T]], limit: int) -> List[T]:
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(awaitable: Awaitable[T]) -> T:
+        async with semaphore:
+            return await awaitable
+
+    return list(await asyncio.gather(*[run(a) for a in awaitables]))
+
+
+class Channel(
+    ChannelInterface[Awaitable[StreamResponse], Awaitable[List[StreamResponse]]]
+):
+    async def gather(self, *awaitables: Awaitable[T], limit: int = 10) -> List[T]:
+        """
+        Awaits many requests concurrently, with at most `limit` of them in flight
+        so the client's connection pool isn't exhausted.
+
+        eg.
+        responses = await channel.gather(
+            *[channel.get_reactions(message_id) for message_id in message_ids]
+        )
+
+        :param awaitables: the requests to run, ie channel or client coroutines
+        :param limit: the maximum number of concurrent requests
+        :return: the results, in the same order as the awaitables
+        """
+        return await gather_limited(awaitables, limit)
+
+    @classmethod
+    async def query_many(
+        cls, channels: Iterable[ChannelInterface], limit: int = 10, **options: Any
+    ) -> List[StreamResponse]:
+        return await gather_limited([c.query(**options) for c in channels], limit)
+
+    async def batch(self, operations: Iterable[Dict]) -> List[StreamResponse]:
+        return await self.gather(*[call() for call in self._batch_calls(operations)])
 
-class Channel(ChannelInterface):
     async def send_message(
         self, message: Dict, user_id: str, **options: Any
     ) -> StreamResponse:
         payload = {"message": add_user_id(message, user_id), **options}
-        return await self.client.post(f"{self.url}/message", data=payload)
+        return await self.client.post(self._path("message"), data=payload)
 
     async def get_messages(self, message_ids: List[str]) -> StreamResponse:
         return await self.client.get(
-            f"{self.url}/messages", params={"ids": ",".join(message_ids)}
+            self._path("messages"), params={"ids": ",".join(message_ids)}
         )
 
     async def send_event(self, event: Dict, user_id: str) -> StreamResponse:
         payload = {"event": add_user_id(event, user_id)}
-        return await self.client.post(f"{self.url}/event", data=payload)
+        return await self.client.post(self._path("event"), data=payload)
 
     async def send_reaction(
         self, message_id: str, reaction: Dict, user_id: str
@@ -44,13 +104,16 @@ class Channel(ChannelInterface):
         return await self.query(**options)
 
     async def query(self, **options: Any) -> StreamResponse:
-        payload = {"state": True, "data": self.custom_data, **options}
+        # read the backing field so query-only handles never allocate their data dict
+        data = self._custom_data if self._custom_data is not None else {}
+        payload = {"state": True, "data": data, **options}
 
-        url = f"channels/{self.channel_type}"
         if self.id is not None:
-            url = f"{url}/{self.id}"
+            url = self._path("query")
+        else:
+            url = f"channels/{self.channel_type}/query"
 
-        state = await self.client.post(f"{url}/query", data=payload)
+        state = await self.client.post(url, data=payload)
 
         if self.id is None:
             self.id = state["channel"]["id"]
@@ -81,63 +144,70 @@ class Channel(ChannelInterface):
     async def update_partial(
         self, to_set: Dict = None, to_unset: Iterable[str] = None
     ) -> StreamResponse:
-        payload = {"set": to_set or {}, "unset": to_unset or []}
+        payload = {"set": to_set or {}, "unset": normalize_unset(to_unset)}
         return await self.client.patch(self.url, data=payload)
 
     async def delete(self) -> StreamResponse:
         return await self.client.delete(self.url)
 
     async def truncate(self, **options: Any) -> StreamResponse:
-        return await self.client.post(f"{self.url}/truncate", data=options)
+        return await self.client.post(self._path("truncate"), data=options)
 
     async def add_members(
         self, members: Iterable[Dict], message: Dict = None, **options: Any
     ) -> StreamResponse:
-        payload = {"add_members": members, "message": message, **options}
+        payload = {"add_members": to_sequence(members), "message": message, **options}
         return await self.client.post(self.url, data=payload)
 
     async def assign_roles(
         self, members: Iterable[Dict], message: Dict = None
     ) -> StreamResponse:
         return await self.client.post(
-            self.url, data={"assign_roles": members, "message": message}
+            self.url, data={"assign_roles": to_sequence(members), "message": message}
         )
 
     async def invite_members(
         self, user_ids: Iterable[str], message: Dict = None
     ) -> StreamResponse:
         return await self.client.post(
-            self.url, data={"invites": user_ids, "message": message}
+            self.url, data={"invites": to_sequence(user_ids), "message": message}
         )
 
     async def add_moderators(
         self, user_ids: Iterable[str], message: Dict = None
     ) -> StreamResponse:
         return await self.client.post(
-            self.url, data={"add_moderators": user_ids, "message": message}
+            self.url, data={"add_moderators": to_sequence(user_ids), "message": message}
         )
 
     async def remove_members(
         self, user_ids: Iterable[str], message: Dict = None
     ) -> StreamResponse:
         return await self.client.post(
-            self.url, data={"remove_members": user_ids, "message": message}
+            self.url, data={"remove_members": to_sequence(user_ids), "message": message}
         )
 
     async def demote_moderators(
         self, user_ids: Iterable[str], message: Dict = None
     ) -> StreamResponse:
         return await self.client.post(
-            self.url, data={"demote_moderators": user_ids, "message": message}
+            self.url,
+            data={"demote_moderators": to_sequence(user_ids), "message": message},
         )
 
+    async def update_members(
+        self, changes: Iterable[Dict], message: Dict = None
+    ) -> StreamResponse:
+        payload = member_changes_payload(changes, message)
+        return await self.client.post(self.url, data=payload)
+
     async def mark_read(self, user_id: str, **data: Any) -> StreamResponse:
-        payload = add_user_id(data, user_id)
-        return await self.client.post(f"{self.url}/read", data=payload)
+        payload = add_user_id_inplace(data, user_id)
+        return await self.client.post(self._path("read"), data=payload)
 
     async def mark_unread(self, user_id: str, **data: Any) -> StreamResponse:
-        payload = add_user_id(data, user_id)
-        return await self.client.post(f"{self.url}/unread", data=payload)
+        payload = add_user_id_inplace(data, user_id)
+        return await self.client.post(self._path("unread"), data=payload)
 
     async def get_replies(self, parent_id: str, **options: Any) -> StreamResponse:
         return await self.client.get(f"messages/{parent_id}/replies", params=options)
@@ -156,14 +226,14 @@ class Channel(ChannelInterface):
         )
 
     async def accept_invite(self, user_id: str, **data: Any) -> StreamResponse:
-        payload = add_user_id(data, user_id)
+        payload = add_user_id_inplace(data, user_id)
         payload["accept_invite"] = True
         response = await self.client.post(self.url, data=payload)
         self.custom_data = response["channel"]
         return response
 
     async def reject_invite(self, user_id: str, **data: Any) -> StreamResponse:
-        payload = add_user_id(data, user_id)
+        payload = add_user_id_inplace(data, user_id)
         payload["reject_invite"] = True
         response = await self.client.post(self.url, data=payload)
         self.custom_data = response["channel"]
@@ -173,27 +243,27 @@ class Channel(ChannelInterface):
         self, url: str, name: str, user: Dict, content_type: str = None
     ) -> StreamResponse:
         return await self.client.send_file(  # type: ignore
-            f"{self.url}/file", url, name, user, content_type=content_type
+            self._path("file"), url, name, user, content_type=content_type
         )
 
     async def send_image(
         self, url: str, name: str, user: Dict, content_type: str = None
     ) -> StreamResponse:
         return await self.client.send_file(  # type: ignore
-            f"{self.url}/image", url, name, user, content_type=content_type
+            self._path("image"), url, name, user, content_type=content_type
         )
 
     async def delete_file(self, url: str) -> StreamResponse:
-        return await self.client.delete(f"{self.url}/file", {"url": url})
+        return await self.client.delete(self._path("file"), {"url": url})
 
     async def delete_image(self, url: str) -> StreamResponse:
-        return await self.client.delete(f"{self.url}/image", {"url": url})
+        return await self.client.delete(self._path("image"), {"url": url})
 
     async def hide(self, user_id: str) -> StreamResponse:
-        return await self.client.post(f"{self.url}/hide", data={"user_id": user_id})
+        return await self.client.post(self._path("hide"), data={"user_id": user_id})
 
     async def show(self, user_id: str) -> StreamResponse:
-        return await self.client.post(f"{self.url}/show", data={"user_id": user_id})
+        return await self.client.post(self._path("show"), data={"user_id": user_id})
 
     async def mute(self, user_id: str, expiration: int = None) -> StreamResponse:
         params: Dict[str, Union[str, int]] = {
@@ -245,5 +315,362 @@ class Channel(ChannelInterface):
         if not user_id:
             raise StreamChannelException("user_id must not be empty")
 
-        payload = {"set": to_set or {}, "unset": to_unset or []}
+        payload = {"set": to_set or {}, "unset": normalize_unset(to_unset)}
         return await self.client.patch(f"{self.url}/member/{user_id}", data=payload)
+
+
+class CachedChannel(  # type: ignore[misc]
+    ReadCacheMixin[Awaitable[StreamResponse], Awaitable[List[StreamResponse]]],
+    Channel,
+):
+    """
+    A channel that memoizes its read-only requests for `read_cache_ttl` seconds.
+    Concurrent identical reads share a single request.
+    See `ReadCacheMixin` for the consistency trade-offs.
+
+    ::
+
+        channel = CachedChannel(client, "messaging", "general", read_cache_ttl=2.0)
+    """
+
+    # writes clear the read cache once they complete, reads made meanwhile included
+    async def send_message(
+        self, message: Dict, user_id: str, **options: Any
+    ) -> StreamResponse:
+        try:
+            return await super().send_message(message, user_id, **options)
+        finally:
+            self.clear_read_cache()
+
+    async def send_event(self, event: Dict, user_id: str) -> StreamResponse:
+        try:
+            return await super().send_event(event, user_id)
+        finally:
+            self.clear_read_cache()
+
+    async def send_reaction(
+        self, message_id: str, reaction: Dict, user_id: str
+    ) -> StreamResponse:
+        try:
+            return await super().send_reaction(message_id, reaction, user_id)
+        finally:
+            self.clear_read_cache()
+
+    async def delete_reaction(
+        self, message_id: str, reaction_type: str, user_id: str
+    ) -> StreamResponse:
+        try:
+            return await super().delete_reaction(message_id, reaction_type, user_id)
+        finally:
+            self.clear_read_cache()
+
+    async def create(self, user_id: str, **options: Any) -> StreamResponse:
+        try:
+            return await super().create(user_id, **options)
+        finally:
+            self.clear_read_cache()
+
+    async def query(self, **options: Any) -> StreamResponse:
+        try:
+            return await super().query(**options)
+        finally:
+            self.clear_read_cache()
+
+    async def update(
+        self, channel_data: Dict, update_message: Dict = None
+    ) -> StreamResponse:
+        try:
+            return await super().update(channel_data, update_message)
+        finally:
+            self.clear_read_cache()
+
+    async def update_partial(
+        self, to_set: Dict = None, to_unset: Iterable[str] = None
+    ) -> StreamResponse:
+        try:
+            return await super().update_partial(to_set, to_unset)
+        finally:
+            self.clear_read_cache()
+
+    async def delete(self) -> StreamResponse:
+        try:
+            return await super().delete()
+        finally:
+            self.clear_read_cache()
+
+    async def truncate(self, **options: Any) -> StreamResponse:
+        try:
+            return await super().truncate(**options)
+        finally:
+            self.clear_read_cache()
+
+    async def add_members(
+        self, members: Iterable[Dict], message: Dict = None, **options: Any
+    ) -> StreamResponse:
+        try:
+            return await super().add_members(members, message, **options)
+        finally:
+            self.clear_read_cache()
+
+    async def assign_roles(
+        self, members: Iterable[Dict], message: Dict = None
+    ) -> StreamResponse:
+        try:
+            return await super().assign_roles(members, message)
+        finally:
+            self.clear_read_cache()
+
+    async def invite_members(
+        self, user_ids: Iterable[str], message: Dict = None
+    ) -> StreamResponse:
+        try:
+            return await super().invite_members(user_ids, message)
+        finally:
+            self.clear_read_cache()
+
+    async def add_moderators(
+        self, user_ids: Iterable[str], message: Dict = None
+    ) -> StreamResponse:
+        try:
+            return await super().add_moderators(user_ids, message)
+        finally:
+            self.clear_read_cache()
+
+    async def remove_members(
+        self, user_ids: Iterable[str], message: Dict = None
+    ) -> StreamResponse:
+        try:
+            return await super().remove_members(user_ids, message)
+        finally:
+            self.clear_read_cache()
+
+    async def demote_moderators(
+        self, user_ids: Iterable[str], message: Dict = None
+    ) -> StreamResponse:
+        try:
+            return await super().demote_moderators(user_ids, message)
+        finally:
+            self.clear_read_cache()
+
+    async def update_members(
+        self, changes: Iterable[Dict], message: Dict = None
+    ) -> StreamResponse:
+        try:
+            return await super().update_members(changes, message)
+        finally:
+            self.clear_read_cache()
+
+    async def mark_read(self, user_id: str, **data: Any) -> StreamResponse:
+        try:
+            return await super().mark_read(user_id, **data)
+        finally:
+            self.clear_read_cache()
+
+    async def mark_unread(self, user_id: str, **data: Any) -> StreamResponse:
+        try:
+            return await super().mark_unread(user_id, **data)
+        finally:
+            self.clear_read_cache()
+
+    async def ban_user(self, target_id: str, **options: Any) -> StreamResponse:
+        try:
+            return await super().ban_user(target_id, **options)
+        finally:
+            self.clear_read_cache()
+
+    async def unban_user(self, target_id: str, **options: Any) -> StreamResponse:
+        try:
+            return await super().unban_user(target_id, **options)
+        finally:
+            self.clear_read_cache()
+
+    async def accept_invite(self, user_id: str, **data: Any) -> StreamResponse:
+        try:
+            return await super().accept_invite(user_id, **data)
+        finally:
+            self.clear_read_cache()
+
+    async def reject_invite(self, user_id: str, **data: Any) -> StreamResponse:
+        try:
+            return await super().reject_invite(user_id, **data)
+        finally:
+            self.clear_read_cache()
+
+    async def send_file(
+        self, url: str, name: str, user: Dict, content_type: str = None
+    ) -> StreamResponse:
+        try:
+            return await super().send_file(url, name, user, content_type)
+        finally:
+            self.clear_read_cache()
+
+    async def send_image(
+        self, url: str, name: str, user: Dict, content_type: str = None
+    ) -> StreamResponse:
+        try:
+            return await super().send_image(url, name, user, content_type)
+        finally:
+            self.clear_read_cache()
+
+    async def delete_file(self, url: str) -> StreamResponse:
+        try:
+            return await super().delete_file(url)
+        finally:
+            self.clear_read_cache()
+
+    async def delete_image(self, url: str) -> StreamResponse:
+        try:
+            return await super().delete_image(url)
+        finally:
+            self.clear_read_cache()
+
+    async def hide(self, user_id: str) -> StreamResponse:
+        try:
+            return await super().hide(user_id)
+        finally:
+            self.clear_read_cache()
+
+    async def show(self, user_id: str) -> StreamResponse:
+        try:
+            return await super().show(user_id)
+        finally:
+            self.clear_read_cache()
+
+    async def mute(self, user_id: str, expiration: int = None) -> StreamResponse:
+        try:
+            return await super().mute(user_id, expiration)
+        finally:
+            self.clear_read_cache()
+
+    async def unmute(self, user_id: str) -> StreamResponse:
+        try:
+            return await super().unmute(user_id)
+        finally:
+            self.clear_read_cache()
+
+    async def pin(self, user_id: str) -> StreamResponse:
+        try:
+            return await super().pin(user_id)
+        finally:
+            self.clear_read_cache()
+
+    async def unpin(self, user_id: str) -> StreamResponse:
+        try:
+            return await super().unpin(user_id)
+        finally:
+            self.clear_read_cache()
+
+    async def archive(self, user_id: str) -> StreamResponse:
+        try:
+            return await super().archive(user_id)
+        finally:
+            self.clear_read_cache()
+
+    async def unarchive(self, user_id: str) -> StreamResponse:
+        try:
+            return await super().unarchive(user_id)
+        finally:
+            self.clear_read_cache()
+
+    async def update_member_partial(
+        self, user_id: str, to_set: Dict = None, to_unset: Iterable[str] = None
+    ) -> StreamResponse:
+        try:
+            return await super().update_member_partial(user_id, to_set, to_unset)
+        finally:
+            self.clear_read_cache()
+
+
+# events that only convey the latest state, so a burst can be sent as its last one
+_COALESCED_EVENT_TYPES = frozenset(["typing.start", "typing.stop"])
+
+
+def _arguments_key(data: Dict[str, Any]) -> str:
+    # calls are only coalesced when their arguments are equal
+    return json.dumps(data, sort_keys=True, default=str)
+
+
+class BatchingChannel(Channel):
+    """
+    A channel that coalesces bursts of read receipts and typing events.
+    Identical `mark_read` calls for the same user, and identical
+    `typing.start`/`typing.stop` events from the same user, made within
+    `flush_delay` seconds are sent as one request. Every caller receives that
+    request's response. Calls with different arguments, ie a newer `message_id`,
+    are sent separately so none of them is lost. Other events are sent right
+    away, one request each.
+
+    ::
+
+        channel = BatchingChannel(client, "messaging", "general", flush_delay=0.05)
+        await channel.mark_read("jo", message_id=last_message_id)
+        await channel.flush()  # send anything still pending, ie on shutdown
+    """
+
+    def __init__(
+        self,
+        client: StreamChatInterface,
+        channel_type: str,
+        channel_id: str = None,
+        custom_data: Dict = None,
+        flush_delay: float = 0.05,
+    ):
+        super().__init__(client, channel_type, channel_id, custom_data)
+        self.flush_delay = flush_delay
+        self._pending_sends: Dict[Hashable, "asyncio.Future[StreamResponse]"] = {}
+        self._flush_now: Optional[asyncio.Event] = None
+
+    async def mark_read(self, user_id: str, **data: Any) -> StreamResponse:
+        return await self._coalesce(
+            ("read", user_id, _arguments_key(data)),
+            super().mark_read,
+            {"user_id": user_id, **data},
+        )
+
+    async def send_event(self, event: Dict, user_id: str) -> StreamResponse:
+        if event.get("type") not in _COALESCED_EVENT_TYPES:
+            return await super().send_event(event, user_id)
+        return await self._coalesce(
+            ("event", user_id, _arguments_key(event)),
+            super().send_event,
+            {"event": event, "user_id": user_id},
+        )
+
+    async def flush(self) -> None:
+        """Sends all pending requests right away and waits for them to complete."""
+        if not self._pending_sends or self._flush_now is None:
+            return
+        sends = list(self._pending_sends.values())
+        self._flush_now.set()
+        try:
+            await asyncio.gather(*sends, return_exceptions=True)
+        finally:
+            self._flush_now.clear()
+
+    async def _coalesce(
+        self,
+        key: Hashable,
+        send: Callable[..., Awaitable[StreamResponse]],
+        kwargs: Dict[str, Any],
+    ) -> StreamResponse:
+        # the key covers the arguments, so callers only share a request they all asked for
+        pending = self._pending_sends.get(key)
+        if pending is None:
+            if self._flush_now is None:
+                self._flush_now = asyncio.Event()
+            pending = asyncio.ensure_future(self._send_later(key, send, kwargs))
+            self._pending_sends[key] = pending
+        return await asyncio.shield(pending)
+
+    async def _send_later(
+        self,
+        key: Hashable,
+        send: Callable[..., Awaitable[StreamResponse]],
+        kwargs: Dict[str, Any],
+    ) -> StreamResponse:
+        try:
+            await asyncio.wait_for(self._flush_now.wait(), self.flush_delay)
+        except asyncio.TimeoutError:
+            pass
+        del self._pending_sends[key]
+        return await send(**kwargs)
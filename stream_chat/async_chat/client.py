@@ -1,3 +1,4 @@
+import asyncio
 import datetime
 import json
 import sys
@@ -66,8 +67,12 @@ class StreamChatAsync(StreamChatInterface, AsyncContextManager):
         )
         self.session = aiohttp.ClientSession(
             base_url=self.base_url,
-            connector=aiohttp.TCPConnector(keepalive_timeout=59.0),
+            connector=aiohttp.TCPConnector(
+                limit=options.get("pool_maxsize", 100), keepalive_timeout=59.0
+            ),
         )
+        # only a session created here is this client's to close
+        self._owns_session = True
 
     def set_http_session(self, session: aiohttp.ClientSession) -> None:
         """
@@ -76,6 +81,18 @@ class StreamChatAsync(StreamChatInterface, AsyncContextManager):
         Make sure you set up a `base_url` for the session.
         """
         self.session = session
+        self._owns_session = False
+
+    async def warm(self, relative_url: str = "") -> None:
+        try:
+            async with self.session.options(
+                "/" + relative_url.lstrip("/"),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            ) as response:
+                await response.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            # the next real request reconnects and reports the error
+            pass
 
     async def _parse_response(self, response: aiohttp.ClientResponse) -> StreamResponse:
         text = await response.text()
@@ -101,8 +118,7 @@ class StreamChatAsync(StreamChatInterface, AsyncContextManager):
         }
         data = data or {}
         serialized = None
-        default_params = self.get_default_params()
-        default_params.update(params)
+        default_params = self.build_params(params)
         headers = get_default_header()
         headers["Authorization"] = self.auth_token
         headers["stream-auth-type"] = "jwt"
@@ -496,7 +512,7 @@ class StreamChatAsync(StreamChatInterface, AsyncContextManager):
         data.add_field("file", content, filename=name, content_type=content_type)
         async with self.session.post(
             "/" + uri.lstrip("/"),
-            params=self.get_default_params(),
+            params=self._default_params,
             data=data,
             headers=headers,
         ) as response:
@@ -734,11 +750,9 @@ class StreamChatAsync(StreamChatInterface, AsyncContextManager):
         if isinstance(before, datetime.datetime):
             before = before.isoformat()
 
-        updates = []
-        for user_id in user_ids:
-            updates.append(
-                {"id": user_id, "set": {"revoke_tokens_issued_before": before}}
-            )
+        # every user gets the same field update, so one dict is shared by all entries
+        fields = {"revoke_tokens_issued_before": before}
+        updates = [{"id": user_id, "set": fields} for user_id in user_ids]
         return await self.update_users_partial(updates)
 
     async def export_channel(
@@ -818,6 +832,17 @@ class StreamChatAsync(StreamChatInterface, AsyncContextManager):
     async def close(self) -> None:
         await self.session.close()
 
+    def __del__(self) -> None:
+        session = getattr(self, "session", None)
+        owns_session = getattr(self, "_owns_session", False)
+        if owns_session and session is not None and not session.closed:
+            warnings.warn(
+                "StreamChatAsync was not closed. Use `async with StreamChatAsync(...)` "
+                "or call `await client.close()` to release its connections.",
+                ResourceWarning,
+                stacklevel=2,
+            )
+
     async def __aenter__(self) -> "StreamChatAsync":
         return self
 
@@ -28,31 +28,29 @@ class Segment(SegmentInterface):
         return state
 
     async def get(self) -> StreamResponse:
-        super().verify_segment_id()
-        return await self.client.get_segment(segment_id=self.segment_id)  # type: ignore
+        segment_id = self.verify_segment_id()
+        return await self.client.get_segment(segment_id=segment_id)  # type: ignore
 
     async def update(self, data: SegmentUpdatableFields) -> StreamResponse:
-        super().verify_segment_id()
+        segment_id = self.verify_segment_id()
         return await self.client.update_segment(  # type: ignore
-            segment_id=self.segment_id, data=data
+            segment_id=segment_id, data=data
         )
 
     async def delete(self) -> StreamResponse:
-        super().verify_segment_id()
-        return await self.client.delete_segment(  # type: ignore
-            segment_id=self.segment_id
-        )
+        segment_id = self.verify_segment_id()
+        return await self.client.delete_segment(segment_id=segment_id)  # type: ignore
 
     async def target_exists(self, target_id: str) -> StreamResponse:
-        super().verify_segment_id()
+        segment_id = self.verify_segment_id()
         return await self.client.segment_target_exists(  # type: ignore
-            segment_id=self.segment_id, target_id=target_id
+            segment_id=segment_id, target_id=target_id
         )
 
     async def add_targets(self, target_ids: list) -> StreamResponse:
-        super().verify_segment_id()
+        segment_id = self.verify_segment_id()
         return await self.client.add_segment_targets(  # type: ignore
-            segment_id=self.segment_id, target_ids=target_ids
+            segment_id=segment_id, target_ids=target_ids
         )
 
     async def query_targets(
@@ -61,16 +59,16 @@ class Segment(SegmentInterface):
         sort: Optional[List[SortParam]] = None,
         options: Optional[QuerySegmentTargetsOptions] = None,
     ) -> StreamResponse:
-        super().verify_segment_id()
+        segment_id = self.verify_segment_id()
         return await self.client.query_segment_targets(  # type: ignore
-            segment_id=self.segment_id,
+            segment_id=segment_id,
             filter_conditions=filter_conditions,
             sort=sort,
             options=options,
         )
 
     async def remove_targets(self, target_ids: list) -> StreamResponse:
-        super().verify_segment_id()
+        segment_id = self.verify_segment_id()
         return await self.client.remove_segment_targets(  # type: ignore
-            segment_id=self.segment_id, target_ids=target_ids
+            segment_id=segment_id, target_ids=target_ids
         )
@@ -1,12 +1,51 @@
 import abc
-from typing import Any, Awaitable, Dict, Iterable, List, Union
+import asyncio
+import functools
+import inspect
+import json
+import sys
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Final,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 from stream_chat.base.client import StreamChatInterface
 from stream_chat.base.exceptions import StreamChannelException
-from stream_chat.types.stream_response import StreamResponse
 
+T = TypeVar("T")
+
+# StreamResponse for the sync client, Awaitable[StreamResponse] for the async one
+TResponse = TypeVar("TResponse")
+# List[StreamResponse] for the sync client, Awaitable[List[StreamResponse]] for the async one
+TResponses = TypeVar("TResponses")
+
+_NON_BATCHABLE_METHODS = frozenset(
+    ["batch", "add_members_bulk", "send_messages", "send_events"]
+)
+
+
+class ChannelInterface(abc.ABC, Generic[TResponse, TResponses]):
+    """
+    A handle to a single channel. It holds no connection of its own: every request
+    goes through the `client` HTTP helpers (`get`, `post`, `patch`, ...), which reuse
+    the client's keep-alive session. Implementations should stick to those helpers
+    so connections and TLS sessions are shared by all channels of a client.
+    """
 
-class ChannelInterface(abc.ABC):
     def __init__(
         self,
         client: StreamChatInterface,
@@ -14,27 +53,151 @@ class ChannelInterface(abc.ABC):
         channel_id: str = None,
         custom_data: Dict = None,
     ):
-        self.channel_type = channel_type
+        # url and cid are cached from these, so the type is fixed for the handle's lifetime
+        self.channel_type: Final[str] = sys.intern(channel_type)
         self.id = channel_id
         self.client = client
-        self.custom_data = custom_data or {}
+        self._custom_data = custom_data
+
+    @property
+    def id(self) -> Optional[str]:
+        return self._id
+
+    @id.setter
+    def id(self, channel_id: Optional[str]) -> None:
+        # url and cid are derived from the id, so drop the cached values
+        if channel_id is not None and type(channel_id) is not str:
+            channel_id = str(channel_id)
+        self._id = channel_id
+        self._url: Optional[str] = None
+        self._cid: Optional[str] = None
+        self._paths: Dict[str, str] = {}
+
+    @property
+    def custom_data(self) -> Dict:
+        # most channel handles never touch their data, so only allocate it on demand
+        if self._custom_data is None:
+            self._custom_data = {}
+        return self._custom_data
+
+    @custom_data.setter
+    def custom_data(self, custom_data: Dict) -> None:
+        self._custom_data = custom_data
 
     @property
     def url(self) -> str:
-        if self.id is None:
-            raise StreamChannelException("channel does not have an id")
-        return f"channels/{self.channel_type}/{self.id}"
+        if self._url is None:
+            if self._id is None:
+                raise StreamChannelException("channel does not have an id")
+            self._url = f"channels/{self.channel_type}/{self._id}"
+        return self._url
 
     @property
     def cid(self) -> str:
-        if self.id is None:
-            raise StreamChannelException("channel does not have an id")
-        return f"{self.channel_type}:{self.id}"
+        if self._cid is None:
+            if self._id is None:
+                raise StreamChannelException("channel does not have an id")
+            self._cid = f"{self.channel_type}:{self._id}"
+        return self._cid
 
-    @abc.abstractmethod
-    def send_message(
-        self, message: Dict, user_id: str, **options: Any
-    ) -> Union[StreamResponse, Awaitable[StreamResponse]]:
+    def prepare(self) -> Union[None, Awaitable[None]]:
+        """
+        Warms up the client's connection before the first request on this channel.
+        Call it at startup for latency-sensitive channels.
+        """
+        return self.client.warm(self.url)
+
+    def _path(self, leaf: str) -> str:
+        """Returns the memoized `{self.url}/{leaf}` path of a channel endpoint."""
+        path = self._paths.get(leaf)
+        if path is None:
+            path = self._paths[leaf] = f"{self.url}/{leaf}"
+        return path
+
+    def batch(self, operations: Iterable[Dict]) -> TResponses:
+        """
+        Runs several channel operations in one go, reusing the client's connection.
+        The async client sends them concurrently.
+
+        eg.
+        channel.batch([
+            {"method": "send_reaction", "args": {"message_id": id1, "reaction": {"type": "love"}, "user_id": "jo"}},
+            {"method": "mark_read", "args": {"user_id": "jo"}},
+        ])
+
+        :param operations: a list of {"method": <channel method name>, "args": {...}}
+        :return: a list of server responses, in the same order as the operations
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not implement batch")
+
+    def add_members_bulk(
+        self, member_batches: Iterable[Iterable[Dict]], **options: Any
+    ) -> TResponses:
+        """
+        Adds several groups of members to the channel using `batch`
+
+        :param member_batches: groups of member objects, one add_members call per group
+        :param options: additional options passed to every add_members call
+        :return: a list of server responses, one per group
+        """
+        return self.batch(
+            [
+                {"method": "add_members", "args": {"members": members, **options}}
+                for members in member_batches
+            ]
+        )
+
+    def send_messages(
+        self, messages: Iterable[Dict], user_id: str, **options: Any
+    ) -> TResponses:
+        """
+        Sends several messages to this channel using `batch`
+
+        :param messages: the Message objects
+        :param user_id: the ID of the user that created the messages
+        :param options: additional options passed to every send_message call
+        :return: a list of server responses, one per message
+        """
+        return self.batch(
+            [
+                {
+                    "method": "send_message",
+                    "args": {"message": message, "user_id": user_id, **options},
+                }
+                for message in messages
+            ]
+        )
+
+    def send_events(self, events: Iterable[Dict], user_id: str) -> TResponses:
+        """
+        Sends several events on this channel using `batch`
+
+        :param events: event data, ie [{type: 'typing.start'}, {type: 'typing.stop'}]
+        :param user_id: the ID of the user sending the events
+        :return: a list of server responses, one per event
+        """
+        return self.batch(
+            [
+                {"method": "send_event", "args": {"event": event, "user_id": user_id}}
+                for event in events
+            ]
+        )
+
+    def _batch_calls(self, operations: Iterable[Dict]) -> List[Callable[[], Any]]:
+        # resolve every operation upfront so a bad entry fails before any request
+        calls: List[Callable[[], Any]] = []
+        for operation in operations:
+            method = operation["method"]
+            if method.startswith("_") or method in _NON_BATCHABLE_METHODS:
+                raise StreamChannelException(f"{method} cannot be batched")
+            func = getattr(self, method, None)
+            if not callable(func):
+                raise StreamChannelException(f"unknown channel method {method}")
+            calls.append(functools.partial(func, **operation.get("args", {})))
+        return calls
+
+    @abc.abstractmethod
+    def send_message(self, message: Dict, user_id: str, **options: Any) -> TResponse:
         """
         Send a message to this channel
 
@@ -45,9 +208,7 @@ class ChannelInterface(abc.ABC):
         pass
 
     @abc.abstractmethod
-    def send_event(
-        self, event: Dict, user_id: str
-    ) -> Union[StreamResponse, Awaitable[StreamResponse]]:
+    def send_event(self, event: Dict, user_id: str) -> TResponse:
         """
         Send an event on this channel
 
@@ -58,9 +219,7 @@ class ChannelInterface(abc.ABC):
         pass
 
     @abc.abstractmethod
-    def send_reaction(
-        self, message_id: str, reaction: Dict, user_id: str
-    ) -> Union[StreamResponse, Awaitable[StreamResponse]]:
+    def send_reaction(self, message_id: str, reaction: Dict, user_id: str) -> TResponse:
         """
         Send a reaction about a message
 
@@ -74,7 +233,7 @@ class ChannelInterface(abc.ABC):
     @abc.abstractmethod
     def delete_reaction(
         self, message_id: str, reaction_type: str, user_id: str
-    ) -> Union[StreamResponse, Awaitable[StreamResponse]]:
+    ) -> TResponse:
         """
         Delete a reaction by user and type
 
@@ -86,9 +245,7 @@ class ChannelInterface(abc.ABC):
         pass
 
     @abc.abstractmethod
-    def create(
-        self, user_id: str, **options: Any
-    ) -> Union[StreamResponse, Awaitable[StreamResponse]]:
+    def create(self, user_id: str, **options: Any) -> TResponse:
         """
         Create the channel
 
@@ -98,9 +255,7 @@ class ChannelInterface(abc.ABC):
         pass
 
     @abc.abstractmethod
-    def get_messages(
-        self, message_ids: List[str]
-    ) -> Union[StreamResponse, Awaitable[StreamResponse]]:
+    def get_messages(self, message_ids: List[str]) -> TResponse:
         """
         Gets many messages
 
@@ -110,7 +265,7 @@ class ChannelInterface(abc.ABC):
         pass
 
     @abc.abstractmethod
-    def query(self, **options: Any) -> Union[StreamResponse, Awaitable[StreamResponse]]:
+    def query(self, **options: Any) -> TResponse:
         """
         Query the API for this channel, get messages, members or other channel fields
 
@@ -119,6 +274,21 @@ class ChannelInterface(abc.ABC):
         """
         pass
 
+    @classmethod
+    def query_many(
+        cls, channels: Iterable["ChannelInterface"], limit: int = 10, **options: Any
+    ) -> TResponses:
+        """
+        Queries many channels concurrently, with at most `limit` requests in flight.
+        The sync client uses a thread pool, the async client the event loop.
+
+        :param channels: the channels to query
+        :param limit: the maximum number of concurrent requests
+        :param options: the query options passed to every `query` call
+        :return: the query responses, in the same order as the channels
+        """
+        raise NotImplementedError(f"{cls.__name__} does not implement query_many")
+
     @abc.abstractmethod
     def query_members(
         self, filter_conditions: Dict, sort: List[Dict] = None, **options: Any
@@ -140,9 +310,7 @@ class ChannelInterface(abc.ABC):
         pass
 
     @abc.abstractmethod
-    def update(
-        self, channel_data: Dict, update_message: Dict = None
-    ) -> Union[StreamResponse, Awaitable[StreamResponse]]:
+    def update(self, channel_data: Dict, update_message: Dict = None) -> TResponse:
         """
         Edit the channel's custom properties
 
@@ -155,7 +323,7 @@ class ChannelInterface(abc.ABC):
     @abc.abstractmethod
     def update_partial(
         self, to_set: Dict = None, to_unset: Iterable[str] = None
-    ) -> Union[StreamResponse, Awaitable[StreamResponse]]:
+    ) -> TResponse:
         """
         Update channel partially
 
@@ -165,7 +333,7 @@ class ChannelInterface(abc.ABC):
         pass
 
     @abc.abstractmethod
-    def delete(self) -> Union[StreamResponse, Awaitable[StreamResponse]]:
+    def delete(self) -> TResponse:
         """
         Delete the channel. Messages are permanently removed.
 
@@ -174,9 +342,7 @@ class ChannelInterface(abc.ABC):
         pass
 
     @abc.abstractmethod
-    def truncate(
-        self, **options: Any
-    ) -> Union[StreamResponse, Awaitable[StreamResponse]]:
+    def truncate(self, **options: Any) -> TResponse:
         """
         Removes all messages from the channel
 
@@ -188,7 +354,7 @@ class ChannelInterface(abc.ABC):
     @abc.abstractmethod
     def add_members(
         self, members: Iterable[Dict], message: Dict = None, **options: Any
-    ) -> Union[StreamResponse, Awaitable[StreamResponse]]:
+    ) -> TResponse:
         """
         Adds members to the channel
 
@@ -200,9 +366,7 @@ class ChannelInterface(abc.ABC):
         pass
 
     @abc.abstractmethod
-    def assign_roles(
-        self, members: Iterable[Dict], message: Dict = None
-    ) -> Union[StreamResponse, Awaitable[StreamResponse]]:
+    def assign_roles(self, members: Iterable[Dict], message: Dict = None) -> TResponse:
         """
         Assigns new roles to specified channel members
 
@@ -215,7 +379,7 @@ class ChannelInterface(abc.ABC):
     @abc.abstractmethod
     def invite_members(
         self, user_ids: Iterable[str], message: Dict = None
-    ) -> Union[StreamResponse, Awaitable[StreamResponse]]:
+    ) -> TResponse:
         """
         invite members to the channel
 
@@ -228,7 +392,7 @@ class ChannelInterface(abc.ABC):
     @abc.abstractmethod
     def add_moderators(
         self, user_ids: Iterable[str], message: Dict = None
-    ) -> Union[StreamResponse, Awaitable[StreamResponse]]:
+    ) -> TResponse:
         """
         Adds moderators to the channel
 
@@ -241,7 +405,7 @@ class ChannelInterface(abc.ABC):
     @abc.abstractmethod
     def remove_members(
         self, user_ids: Iterable[str], message: Dict = None
-    ) -> Union[StreamResponse, Awaitable[StreamResponse]]:
+    ) -> TResponse:
         """
         Remove members from the channel
 
@@ -254,7 +418,7 @@ class ChannelInterface(abc.ABC):
     @abc.abstractmethod
     def demote_moderators(
         self, user_ids: Iterable[str], message: Dict = None
-    ) -> Union[StreamResponse, Awaitable[StreamResponse]]:
+    ) -> TResponse:
         """
         Demotes moderators from the channel
 
@@ -264,10 +428,28 @@ class ChannelInterface(abc.ABC):
         """
         pass
 
+    def update_members(
+        self, changes: Iterable[Dict], message: Dict = None
+    ) -> TResponse:
+        """
+        Applies several membership changes with a single request
+
+        :param changes: change objects, ie {"op": "add", "user_id": "jo"} where op is one of
+            add, remove, invite, promote, demote or assign_role (which also needs a "role")
+        :param message: An optional to show
+        :return: The server response
+
+        eg.
+        channel.update_members([
+            {"op": "add", "user_id": "jo"},
+            {"op": "promote", "user_id": "jo"},
+            {"op": "assign_role", "user_id": "ann", "role": "channel_member"},
+        ])
+        """
+        return self.client.post(self.url, data=member_changes_payload(changes, message))
+
     @abc.abstractmethod
-    def mark_read(
-        self, user_id: str, **data: Any
-    ) -> Union[StreamResponse, Awaitable[StreamResponse]]:
+    def mark_read(self, user_id: str, **data: Any) -> TResponse:
         """
         Send the mark read event for this user, only works if the `read_events` setting is enabled
 
@@ -278,9 +460,7 @@ class ChannelInterface(abc.ABC):
         pass
 
     @abc.abstractmethod
-    def mark_unread(
-        self, user_id: str, **data: Any
-    ) -> Union[StreamResponse, Awaitable[StreamResponse]]:
+    def mark_unread(self, user_id: str, **data: Any) -> TResponse:
         """
         Marks channel as unread from a specific message or thread, if thread_id is provided in data
         a thread will be searched, otherwise a message.
@@ -292,9 +472,7 @@ class ChannelInterface(abc.ABC):
         pass
 
     @abc.abstractmethod
-    def get_replies(
-        self, parent_id: str, **options: Any
-    ) -> Union[StreamResponse, Awaitable[StreamResponse]]:
+    def get_replies(self, parent_id: str, **options: Any) -> TResponse:
         """
         List the message replies for a parent message
 
@@ -305,9 +483,7 @@ class ChannelInterface(abc.ABC):
         pass
 
     @abc.abstractmethod
-    def get_reactions(
-        self, message_id: str, **options: Any
-    ) -> Union[StreamResponse, Awaitable[StreamResponse]]:
+    def get_reactions(self, message_id: str, **options: Any) -> TResponse:
         """
         List the reactions, supports pagination
 
@@ -318,9 +494,7 @@ class ChannelInterface(abc.ABC):
         pass
 
     @abc.abstractmethod
-    def ban_user(
-        self, target_id: str, **options: Any
-    ) -> Union[StreamResponse, Awaitable[StreamResponse]]:
+    def ban_user(self, target_id: str, **options: Any) -> TResponse:
         """
         Bans a user from this channel
 
@@ -331,9 +505,7 @@ class ChannelInterface(abc.ABC):
         pass
 
     @abc.abstractmethod
-    def unban_user(
-        self, target_id: str, **options: Any
-    ) -> Union[StreamResponse, Awaitable[StreamResponse]]:
+    def unban_user(self, target_id: str, **options: Any) -> TResponse:
         """
         Removes the ban for a user on this channel
 
@@ -343,18 +515,14 @@ class ChannelInterface(abc.ABC):
         pass
 
     @abc.abstractmethod
-    def accept_invite(
-        self, user_id: str, **data: Any
-    ) -> Union[StreamResponse, Awaitable[StreamResponse]]:
+    def accept_invite(self, user_id: str, **data: Any) -> TResponse:
         """
         Accepts an invitation to this channel.
         """
         pass
 
     @abc.abstractmethod
-    def reject_invite(
-        self, user_id: str, **data: Any
-    ) -> Union[StreamResponse, Awaitable[StreamResponse]]:
+    def reject_invite(self, user_id: str, **data: Any) -> TResponse:
         """
         Rejects an invitation to this channel.
         """
@@ -363,7 +531,7 @@ class ChannelInterface(abc.ABC):
     @abc.abstractmethod
     def send_file(
         self, url: str, name: str, user: Dict, content_type: str = None
-    ) -> Union[StreamResponse, Awaitable[StreamResponse]]:
+    ) -> TResponse:
         """
         Uploads a file.
         This functionality defaults to using the Stream CDN. If you would like, you can
@@ -374,7 +542,7 @@ class ChannelInterface(abc.ABC):
     @abc.abstractmethod
     def send_image(
         self, url: str, name: str, user: Dict, content_type: str = None
-    ) -> Union[StreamResponse, Awaitable[StreamResponse]]:
+    ) -> TResponse:
         """
         Uploads an image.
         Stream supported image types are: image/bmp, image/gif, image/jpeg, image/png, image/webp,
@@ -385,23 +553,21 @@ class ChannelInterface(abc.ABC):
         pass
 
     @abc.abstractmethod
-    def delete_file(self, url: str) -> Union[StreamResponse, Awaitable[StreamResponse]]:
+    def delete_file(self, url: str) -> TResponse:
         """
         Deletes a file by file url.
         """
         pass
 
     @abc.abstractmethod
-    def delete_image(
-        self, url: str
-    ) -> Union[StreamResponse, Awaitable[StreamResponse]]:
+    def delete_image(self, url: str) -> TResponse:
         """
         Deletes an image by image url.
         """
         pass
 
     @abc.abstractmethod
-    def hide(self, user_id: str) -> Union[StreamResponse, Awaitable[StreamResponse]]:
+    def hide(self, user_id: str) -> TResponse:
         """
         Removes a channel from query channel requests for that user until a new message is added.
         Use `show` to cancel this operation.
@@ -409,7 +575,7 @@ class ChannelInterface(abc.ABC):
         pass
 
     @abc.abstractmethod
-    def show(self, user_id: str) -> Union[StreamResponse, Awaitable[StreamResponse]]:
+    def show(self, user_id: str) -> TResponse:
         """
         Shows a previously hidden channel.
         Use `hide` to hide a channel.
@@ -417,9 +583,7 @@ class ChannelInterface(abc.ABC):
         pass
 
     @abc.abstractmethod
-    def mute(
-        self, user_id: str, expiration: int = None
-    ) -> Union[StreamResponse, Awaitable[StreamResponse]]:
+    def mute(self, user_id: str, expiration: int = None) -> TResponse:
         """
         Mutes a channel.
         Messages added to a muted channel will not trigger push notifications, nor change the
@@ -430,7 +594,7 @@ class ChannelInterface(abc.ABC):
         pass
 
     @abc.abstractmethod
-    def unmute(self, user_id: str) -> Union[StreamResponse, Awaitable[StreamResponse]]:
+    def unmute(self, user_id: str) -> TResponse:
         """
         Unmutes a channel.
         Messages added to a muted channel will not trigger push notifications, nor change the
@@ -441,7 +605,7 @@ class ChannelInterface(abc.ABC):
         pass
 
     @abc.abstractmethod
-    def pin(self, user_id: str) -> Union[StreamResponse, Awaitable[StreamResponse]]:
+    def pin(self, user_id: str) -> TResponse:
         """
         Pins a channel
         Allows a user to pin the channel (only for themselves)
@@ -449,7 +613,7 @@ class ChannelInterface(abc.ABC):
         pass
 
     @abc.abstractmethod
-    def unpin(self, user_id: str) -> Union[StreamResponse, Awaitable[StreamResponse]]:
+    def unpin(self, user_id: str) -> TResponse:
         """
         Unpins a channel
         Allows a user to unpin the channel (only for themselves)
@@ -457,7 +621,7 @@ class ChannelInterface(abc.ABC):
         pass
 
     @abc.abstractmethod
-    def archive(self, user_id: str) -> Union[StreamResponse, Awaitable[StreamResponse]]:
+    def archive(self, user_id: str) -> TResponse:
         """
         Pins a channel
         Allows a user to archive the channel (only for themselves)
@@ -465,9 +629,7 @@ class ChannelInterface(abc.ABC):
         pass
 
     @abc.abstractmethod
-    def unarchive(
-        self, user_id: str
-    ) -> Union[StreamResponse, Awaitable[StreamResponse]]:
+    def unarchive(self, user_id: str) -> TResponse:
         """
         Unpins a channel
         Allows a user to unpin the channel (only for themselves)
@@ -477,7 +639,7 @@ class ChannelInterface(abc.ABC):
     @abc.abstractmethod
     def update_member_partial(
         self, user_id: str, to_set: Dict = None, to_unset: Iterable[str] = None
-    ) -> Union[StreamResponse, Awaitable[StreamResponse]]:
+    ) -> TResponse:
         """
         Update channel member partially
 
@@ -487,5 +649,153 @@ class ChannelInterface(abc.ABC):
         pass
 
 
+_READ_CACHE_SIZE = 256
+
+
+class ReadCacheMixin(ChannelInterface[TResponse, TResponses]):
+    """
+    Memoizes the read-only channel requests (get_messages, get_reactions, get_replies
+    and query_members) for `read_cache_ttl` seconds. Concrete classes override every
+    other request method to call `clear_read_cache` once the request has completed,
+    so writes made through the same channel handle are visible to the next read.
+    Changes made elsewhere can be missed for up to `read_cache_ttl` seconds. Cached
+    responses are shared between callers and must not be mutated. Once
+    `_READ_CACHE_SIZE` entries are held the least recently used one is evicted.
+    """
+
+    def __init__(
+        self,
+        client: StreamChatInterface,
+        channel_type: str,
+        channel_id: str = None,
+        custom_data: Dict = None,
+        read_cache_ttl: float = 2.0,
+    ):
+        super().__init__(client, channel_type, channel_id, custom_data)
+        self.read_cache_ttl = read_cache_ttl
+        self._read_cache: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._read_cache_generation = 0
+
+    def clear_read_cache(self) -> None:
+        self._read_cache.clear()
+        self._read_cache_generation += 1
+
+    # the concrete channel comes after this mixin in the MRO, so super() is not abstract
+    def get_messages(self, message_ids: List[str]) -> TResponse:
+        method = super().get_messages  # type: ignore[safe-super]
+        return self._cached_read("get_messages", method, message_ids)
+
+    def get_reactions(self, message_id: str, **options: Any) -> TResponse:
+        method = super().get_reactions  # type: ignore[safe-super]
+        return self._cached_read("get_reactions", method, message_id, **options)
+
+    def get_replies(self, parent_id: str, **options: Any) -> TResponse:
+        method = super().get_replies  # type: ignore[safe-super]
+        return self._cached_read("get_replies", method, parent_id, **options)
+
+    def query_members(
+        self, filter_conditions: Dict, sort: List[Dict] = None, **options: Any
+    ) -> Any:
+        method = super().query_members  # type: ignore[safe-super]
+        return self._cached_read(
+            "query_members", method, filter_conditions, sort, **options
+        )
+
+    def _cached_read(
+        self, name: str, method: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> Any:
+        key = json.dumps([name, args, kwargs], sort_keys=True, default=str)
+        now = time.monotonic()
+        entry = self._read_cache.get(key)
+        if entry is not None and entry[0] > now:
+            self._read_cache.move_to_end(key)
+            return _shared(entry[1])
+
+        generation = self._read_cache_generation
+        result = method(*args, **kwargs)
+        if inspect.isawaitable(result):
+            # cache the task: awaiting a finished task again returns its result
+            result = asyncio.ensure_future(result)
+            result.add_done_callback(functools.partial(self._evict_failed, key))
+        if generation != self._read_cache_generation:
+            # a write completed while this read was in flight, its response may predate it
+            return _shared(result)
+        if len(self._read_cache) >= _READ_CACHE_SIZE:
+            self._read_cache.popitem(last=False)
+        self._read_cache[key] = (now + self.read_cache_ttl, result)
+        return _shared(result)
+
+    def _evict_failed(self, key: str, future: "asyncio.Future[Any]") -> None:
+        if future.cancelled() or future.exception() is not None:
+            entry = self._read_cache.get(key)
+            if entry is not None and entry[1] is future:
+                del self._read_cache[key]
+
+
+def _shared(result: Any) -> Any:
+    # each awaiter gets its own shield, so cancelling one caller leaves the cached task running
+    if isinstance(result, asyncio.Future):
+        return asyncio.shield(result)
+    return result
+
+
+_MEMBER_CHANGE_FIELDS = {
+    "add": "add_members",
+    "remove": "remove_members",
+    "invite": "invites",
+    "promote": "add_moderators",
+    "demote": "demote_moderators",
+    "assign_role": "assign_roles",
+}
+
+
+def member_changes_payload(changes: Iterable[Dict], message: Dict = None) -> Dict:
+    payload: Dict[str, Any] = {"message": message}
+    for change in changes:
+        op = change["op"]
+        field = _MEMBER_CHANGE_FIELDS.get(op)
+        if field is None:
+            raise StreamChannelException(f"unknown member change {op}")
+        if op == "assign_role":
+            value: Any = {"user_id": change["user_id"], "channel_role": change["role"]}
+        else:
+            value = change["user_id"]
+        payload.setdefault(field, []).append(value)
+    return payload
+
+
+def to_sequence(items: Optional[Iterable[T]]) -> Optional[Sequence[T]]:
+    """
+    Materializes an iterable once so it can be JSON encoded. Lists and tuples are
+    returned as is, so passing one of those is the cheapest option. None is passed
+    through to the payload unchanged. A bare string, bytes or mapping is rejected
+    rather than expanded into characters or keys.
+    """
+    if items is None or isinstance(items, (list, tuple)):
+        return items
+    if isinstance(items, (str, bytes, Mapping)):
+        raise TypeError(
+            f"expected an iterable of items, got a single {type(items).__name__}"
+        )
+    return tuple(items)
+
+
+def normalize_unset(to_unset: Optional[Iterable[str]]) -> Sequence[str]:
+    """Materializes the keys to unset once, dropping duplicates but keeping their order."""
+    if not to_unset:
+        return ()
+    if isinstance(to_unset, (str, bytes)):
+        raise TypeError("to_unset must be an iterable of keys, not a single string")
+    return tuple(dict.fromkeys(to_unset))
+
+
 def add_user_id(payload: Dict, user_id: str) -> Dict:
-    return {**payload, "user": {"id": user_id}}
+    payload = payload.copy()
+    payload["user"] = {"id": user_id}
+    return payload
+
+
+def add_user_id_inplace(payload: Dict, user_id: str) -> Dict:
+    """Like `add_user_id`, but mutates the payload. Only use it on dicts you own."""
+    payload["user"] = {"id": user_id}
+    return payload
@@ -1,11 +1,26 @@
 import abc
-import collections
+import base64
+import calendar
 import datetime
-import hashlib
-import hmac
+import functools
+import json
 import os
 import sys
-from typing import Any, Awaitable, Dict, Iterable, List, Optional, TypeVar, Union
+from collections.abc import Mapping
+from hmac import HMAC, compare_digest
+from hmac import digest as hmac_digest
+from hmac import new as hmac_new
+from typing import (
+    Any,
+    Awaitable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 from stream_chat.types.base import SortParam
 from stream_chat.types.campaign import CampaignData, QueryCampaignsOptions
@@ -22,8 +37,6 @@ if sys.version_info >= (3, 8):
 else:
     from typing_extensions import Literal
 
-import jwt
-
 from stream_chat.types.stream_response import StreamResponse
 
 TChannel = TypeVar("TChannel")
@@ -33,43 +46,117 @@ TSegment = TypeVar("TSegment")
 TCampaign = TypeVar("TCampaign")
 
 
+# base64url of {"alg":"HS256","typ":"JWT"}, the header PyJWT emits for HS256
+_HS256_HEADER = b"eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9."
+
+
+def _b64url(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _hs256(
+    payload: Dict[str, Any], api_secret: str, keyed_mac: Optional[HMAC] = None
+) -> str:
+    # same output as jwt.encode(payload, api_secret, algorithm="HS256") without PyJWT's per-call setup
+    for claim in ("exp", "iat", "nbf"):
+        value = payload.get(claim)
+        if isinstance(value, datetime.datetime):
+            payload[claim] = calendar.timegm(value.utctimetuple())
+    signing_input = _HS256_HEADER + _b64url(
+        json.dumps(payload, separators=(",", ":")).encode()
+    )
+    if keyed_mac is None:
+        signature = hmac_digest(api_secret.encode(), signing_input, "sha256")
+    else:
+        # a copy of an HMAC already keyed with api_secret skips the key schedule
+        mac = keyed_mac.copy()
+        mac.update(signing_input)
+        signature = mac.digest()
+    return (signing_input + b"." + _b64url(signature)).decode()
+
+
+def _user_payload(
+    user_id: str, exp: Optional[int], iat: Optional[int], claims: Dict[str, Any]
+) -> Dict[str, Any]:
+    payload: Dict[str, Any] = {**claims, "user_id": user_id}
+    if exp is not None:
+        payload["exp"] = exp
+    if iat is not None:
+        payload["iat"] = iat
+    return payload
+
+
+@functools.lru_cache(maxsize=128)
+def _server_auth_token(api_secret: str) -> str:
+    # the server token has a constant payload and no expiry, so clients sharing a secret can share it
+    return _hs256({"server": True}, api_secret)
+
+
 class StreamChatInterface(abc.ABC):
     def __init__(
         self, api_key: str, api_secret: str, timeout: float = 6.0, **options: Any
     ):
         self.api_key = api_key
+        self._default_params = {"api_key": api_key}
         self.api_secret = api_secret
-        self.timeout = timeout
-
-        if os.getenv("STREAM_CHAT_TIMEOUT"):
-            self.timeout = float(os.environ["STREAM_CHAT_TIMEOUT"])
+        # keyed once; verify_webhook copies it instead of redoing the key schedule
+        self._webhook_hmac = hmac_new(api_secret.encode(), digestmod="sha256")
+        env_timeout = os.environ.get("STREAM_CHAT_TIMEOUT")
+        self.timeout = float(env_timeout) if env_timeout else timeout
 
         self.options = options
-        self.base_url = "https://chat.stream-io-api.com"
+        self.base_url = (
+            options.get("base_url")
+            or os.environ.get("STREAM_CHAT_URL")
+            or "https://chat.stream-io-api.com"
+        )
 
-        if options.get("base_url"):
-            self.base_url = options["base_url"]
-        elif os.getenv("STREAM_CHAT_URL"):
-            self.base_url = os.environ["STREAM_CHAT_URL"]
+        self._auth_token: Optional[str] = None
 
-        self.auth_token = jwt.encode(
-            {"server": True}, self.api_secret, algorithm="HS256"
-        )
+    @property
+    def auth_token(self) -> str:
+        if self._auth_token is None:
+            self._auth_token = _server_auth_token(self.api_secret)
+        return self._auth_token
+
+    @auth_token.setter
+    def auth_token(self, token: str) -> None:
+        self._auth_token = token
 
     def get_default_params(self) -> Dict[str, str]:
-        return {"api_key": self.api_key}
+        return self._default_params.copy()
+
+    def build_params(self, params: Optional[Dict] = None) -> Dict[str, Any]:
+        """
+        Merge request params over the default ones into a fresh dict
+
+        :param params: query params for a single request
+        :return: dict
+        """
+        if not params:
+            return self._default_params.copy()
+        return {**self._default_params, **params}
 
     def normalize_sort(self, sort: Union[Dict, List[Dict]] = None) -> List[Dict]:
-        sort_fields = []
-        if isinstance(sort, collections.abc.Mapping):
+        if not sort:
+            return []
+        # a single plain dict is the common case: no list wrap, no ABCMeta check
+        if type(sort) is dict:
+            if "field" in sort and "direction" in sort:
+                return [sort]
+            return [{"field": k, "direction": v} for k, v in sort.items()]
+        if isinstance(sort, Mapping):
             sort = [sort]  # type: ignore
-        if isinstance(sort, list):
-            for item in sort:
-                if "field" in item and "direction" in item:
-                    sort_fields.append(item)
-                else:
-                    for k, v in item.items():
-                        sort_fields.append({"field": k, "direction": v})
+        elif not isinstance(sort, (list, tuple)):
+            return []
+
+        sort_fields: List[Dict] = []
+        append, extend = sort_fields.append, sort_fields.extend
+        for item in sort:
+            if "field" in item and "direction" in item:
+                append(item)
+            else:
+                extend([{"field": k, "direction": v} for k, v in item.items()])
         return sort_fields
 
     def create_token(
@@ -87,12 +174,30 @@ class StreamChatInterface(abc.ABC):
         By default, user tokens are valid indefinitely. You can set an `exp`
         or issued at (`iat`) claim as well.
         """
-        payload: Dict[str, Any] = {**claims, "user_id": user_id}
-        if exp:
-            payload["exp"] = exp
-        if iat:
-            payload["iat"] = iat
-        return jwt.encode(payload, self.api_secret, algorithm="HS256")
+        if not claims and exp is None and iat is None:
+            # most tokens carry only user_id, which needs no merge or datetime checks
+            return _hs256({"user_id": user_id}, self.api_secret)
+        return _hs256(_user_payload(user_id, exp, iat, claims), self.api_secret)
+
+    def create_tokens(
+        self,
+        user_ids: Iterable[str],
+        exp: Optional[int] = None,
+        iat: Optional[int] = None,
+        **claims: Any,
+    ) -> List[str]:
+        """
+        Creates a JWT for each of the given users, in order.
+        Produces the same tokens as calling `create_token` per user, but signs
+        them from a single pre-keyed HMAC, which suits bulk onboarding or
+        seeding scripts.
+        """
+        api_secret = self.api_secret
+        keyed_mac = hmac_new(api_secret.encode(), digestmod="sha256")
+        return [
+            _hs256(_user_payload(user_id, exp, iat, claims), api_secret, keyed_mac)
+            for user_id in user_ids
+        ]
 
     def create_search_params(
         self,
@@ -101,35 +206,61 @@ class StreamChatInterface(abc.ABC):
         sort: List[Dict] = None,
         **options: Any,
     ) -> Dict[str, Any]:
-        params = options.copy()
-        if isinstance(query, str):
-            params.update({"query": query})
-        else:
-            params.update({"message_filter_conditions": query})
-
-        params.update({"filter_conditions": filter_conditions})
+        query_key = "query" if isinstance(query, str) else "message_filter_conditions"
+        params = {
+            **options,
+            query_key: query,
+            "filter_conditions": filter_conditions,
+        }
         if sort:
-            params.update({"sort": self.normalize_sort(sort)})
+            params["sort"] = self.normalize_sort(sort)
 
         return params
 
     def verify_webhook(
-        self, request_body: bytes, x_signature: Union[str, bytes]
+        self,
+        request_body: Union[bytes, bytearray, memoryview],
+        x_signature: Union[str, bytes],
     ) -> bool:
         """
         Verify the signature added to a webhook event
 
-        :param request_body: the request body received from webhook
+        :param request_body: the request body received from webhook, any bytes-like
+            buffer (ie. the raw ASGI/WSGI body) is hashed without copying
         :param x_signature: the x-signature header included in the request
         :return: bool
         """
-        if isinstance(x_signature, bytes):
-            x_signature = x_signature.decode()
+        # a hex encoded SHA-256 digest is always 64 characters long
+        if not x_signature or len(x_signature) != 64:
+            return False
+        try:
+            if isinstance(x_signature, bytes):
+                x_signature = x_signature.decode()
+            # the signature is a lowercase hexdigest, other spellings never matched
+            if x_signature != x_signature.lower():
+                return False
+            expected = bytes.fromhex(x_signature)
+        except ValueError:
+            return False
+
+        mac = self._webhook_hmac.copy()
+        mac.update(request_body)
+        return compare_digest(mac.digest(), expected)
+
+    def verify_webhooks(
+        self,
+        events: Iterable[Tuple[Union[bytes, bytearray, memoryview], Union[str, bytes]]],
+    ) -> List[bool]:
+        """
+        Verify the signatures of several webhook events at once
 
-        signature = hmac.new(
-            key=self.api_secret.encode(), msg=request_body, digestmod=hashlib.sha256
-        ).hexdigest()
-        return signature == x_signature
+        :param events: pairs of request body and x-signature header
+        :return: one bool per event, in order
+        """
+        verify = self.verify_webhook
+        return [
+            verify(request_body, x_signature) for request_body, x_signature in events
+        ]
 
     @abc.abstractmethod
     def update_app_settings(
@@ -1360,6 +1491,18 @@ class StreamChatInterface(abc.ABC):
         """
         pass
 
+    def warm(self, relative_url: str = "") -> Union[None, Awaitable[None]]:
+        """
+        Opens a connection to the API ahead of the first request, so that DNS
+        resolution and the TCP/TLS handshakes are not paid by a latency-sensitive
+        call. The connection stays in the client's keep-alive pool. Warming up is
+        best effort: connection errors are ignored, and the default implementation
+        does nothing.
+
+        :param relative_url: the path to send the lightweight OPTIONS request to
+        """
+        return None
+
     #####################
     #  Private methods  #
     #####################
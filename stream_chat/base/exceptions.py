@@ -1,5 +1,5 @@
 import json
-from typing import Dict
+from typing import Any, Dict, Optional, Tuple
 
 
 class StreamChannelException(Exception):
@@ -7,18 +7,49 @@ class StreamChannelException(Exception):
 
 
 class StreamAPIException(Exception):
+    __slots__ = ("response_text", "status_code", "_parsed", "_error")
+
     def __init__(self, text: str, status_code: int) -> None:
         self.response_text = text
         self.status_code = status_code
-        self.json_response = False
-
-        try:
-            parsed_response: Dict = json.loads(text)
-            self.error_code = parsed_response.get("code", "unknown")
-            self.error_message = parsed_response.get("message", "unknown")
-            self.json_response = True
-        except ValueError:
-            pass
+        # the body is parsed on first access, callers that only look at status_code never pay for it
+        self._parsed = False
+        self._error: Optional[Tuple[Any, Any]] = None
+
+    def _parse_error(self) -> Optional[Tuple[Any, Any]]:
+        if not self._parsed:
+            self._parsed = True
+            text = self.response_text.lstrip() if self.response_text else ""
+            # only a JSON object carries error fields, skip the parser for empty or HTML bodies
+            if text[:1] != "{":
+                return None
+            try:
+                parsed_response: Dict = json.loads(text)
+                self._error = (
+                    parsed_response.get("code", "unknown"),
+                    parsed_response.get("message", "unknown"),
+                )
+            except ValueError:
+                pass
+        return self._error
+
+    @property
+    def json_response(self) -> bool:
+        return self._parse_error() is not None
+
+    @property
+    def error_code(self) -> Any:
+        error = self._parse_error()
+        if error is None:
+            raise AttributeError("error_code")
+        return error[0]
+
+    @property
+    def error_message(self) -> Any:
+        error = self._parse_error()
+        if error is None:
+            raise AttributeError("error_message")
+        return error[1]
 
     def __str__(self) -> str:
         if self.json_response:
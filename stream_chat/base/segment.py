@@ -72,9 +72,11 @@ class SegmentInterface(abc.ABC):
     ) -> Union[StreamResponse, Awaitable[StreamResponse]]:
         pass
 
-    def verify_segment_id(self) -> None:
-        if not self.segment_id:
+    def verify_segment_id(self) -> str:
+        segment_id = self.segment_id
+        if not segment_id:
             raise ValueError(
                 "Segment id is missing. Either create the segment using segment.create() "
                 "or set the id during instantiation - segment = Segment(segment_id=segment_id)"
             )
+        return segment_id
@@ -1,21 +1,40 @@
 import json
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, Iterable, List, Union
 
-from stream_chat.base.channel import ChannelInterface, add_user_id
+from stream_chat.base.channel import (
+    ChannelInterface,
+    ReadCacheMixin,
+    add_user_id,
+    add_user_id_inplace,
+    member_changes_payload,
+    normalize_unset,
+    to_sequence,
+)
 from stream_chat.base.exceptions import StreamChannelException
 from stream_chat.types.stream_response import StreamResponse
 
 
-class Channel(ChannelInterface):
+class Channel(ChannelInterface[StreamResponse, List[StreamResponse]]):
+    @classmethod
+    def query_many(
+        cls, channels: Iterable[ChannelInterface], limit: int = 10, **options: Any
+    ) -> List[StreamResponse]:
+        with ThreadPoolExecutor(max_workers=limit) as executor:
+            return list(executor.map(lambda c: c.query(**options), channels))
+
+    def batch(self, operations: Iterable[Dict]) -> List[StreamResponse]:
+        return [call() for call in self._batch_calls(operations)]
+
     def send_message(
         self, message: Dict, user_id: str, **options: Any
     ) -> StreamResponse:
         payload = {"message": add_user_id(message, user_id), **options}
-        return self.client.post(f"{self.url}/message", data=payload)
+        return self.client.post(self._path("message"), data=payload)
 
     def send_event(self, event: Dict, user_id: str) -> StreamResponse:
         payload = {"event": add_user_id(event, user_id)}
-        return self.client.post(f"{self.url}/event", data=payload)
+        return self.client.post(self._path("event"), data=payload)
 
     def send_reaction(
         self, message_id: str, reaction: Dict, user_id: str
@@ -40,17 +59,20 @@ class Channel(ChannelInterface):
 
     def get_messages(self, message_ids: List[str]) -> StreamResponse:
         return self.client.get(
-            f"{self.url}/messages", params={"ids": ",".join(message_ids)}
+            self._path("messages"), params={"ids": ",".join(message_ids)}
         )
 
     def query(self, **options: Any) -> StreamResponse:
-        payload = {"state": True, "data": self.custom_data, **options}
+        # read the backing field so query-only handles never allocate their data dict
+        data = self._custom_data if self._custom_data is not None else {}
+        payload = {"state": True, "data": data, **options}
 
-        url = f"channels/{self.channel_type}"
         if self.id is not None:
-            url = f"{url}/{self.id}"
+            url = self._path("query")
+        else:
+            url = f"channels/{self.channel_type}/query"
 
-        state = self.client.post(f"{url}/query", data=payload)
+        state = self.client.post(url, data=payload)
 
         if self.id is None:
             self.id: str = state["channel"]["id"]
@@ -79,14 +101,14 @@ class Channel(ChannelInterface):
     def update_partial(
         self, to_set: Dict = None, to_unset: Iterable[str] = None
     ) -> StreamResponse:
-        payload = {"set": to_set or {}, "unset": to_unset or []}
+        payload = {"set": to_set or {}, "unset": normalize_unset(to_unset)}
         return self.client.patch(self.url, data=payload)
 
     def delete(self) -> StreamResponse:
         return self.client.delete(self.url)
 
     def truncate(self, **options: Any) -> StreamResponse:
-        return self.client.post(f"{self.url}/truncate", data=options)
+        return self.client.post(self._path("truncate"), data=options)
 
     def add_members(
         self,
@@ -94,51 +116,58 @@ class Channel(ChannelInterface):
         message: Dict = None,
         **options: Any,
     ) -> StreamResponse:
-        payload = {"add_members": members, "message": message, **options}
+        payload = {"add_members": to_sequence(members), "message": message, **options}
         return self.client.post(self.url, data=payload)
 
     def assign_roles(
         self, members: Iterable[Dict], message: Dict = None
     ) -> StreamResponse:
         return self.client.post(
-            self.url, data={"assign_roles": members, "message": message}
+            self.url, data={"assign_roles": to_sequence(members), "message": message}
         )
 
     def invite_members(
         self, user_ids: Iterable[str], message: Dict = None
     ) -> StreamResponse:
         return self.client.post(
-            self.url, data={"invites": user_ids, "message": message}
+            self.url, data={"invites": to_sequence(user_ids), "message": message}
         )
 
     def add_moderators(
         self, user_ids: Iterable[str], message: Dict = None
     ) -> StreamResponse:
         return self.client.post(
-            self.url, data={"add_moderators": user_ids, "message": message}
+            self.url, data={"add_moderators": to_sequence(user_ids), "message": message}
         )
 
     def remove_members(
         self, user_ids: Iterable[str], message: Dict = None
     ) -> StreamResponse:
         return self.client.post(
-            self.url, data={"remove_members": user_ids, "message": message}
+            self.url, data={"remove_members": to_sequence(user_ids), "message": message}
         )
 
     def demote_moderators(
         self, user_ids: Iterable[str], message: Dict = None
     ) -> StreamResponse:
         return self.client.post(
-            self.url, data={"demote_moderators": user_ids, "message": message}
+            self.url,
+            data={"demote_moderators": to_sequence(user_ids), "message": message},
         )
 
+    def update_members(
+        self, changes: Iterable[Dict], message: Dict = None
+    ) -> StreamResponse:
+        payload = member_changes_payload(changes, message)
+        return self.client.post(self.url, data=payload)
+
     def mark_read(self, user_id: str, **data: Any) -> StreamResponse:
-        payload = add_user_id(data, user_id)
-        return self.client.post(f"{self.url}/read", data=payload)
+        payload = add_user_id_inplace(data, user_id)
+        return self.client.post(self._path("read"), data=payload)
 
     def mark_unread(self, user_id: str, **data: Any) -> StreamResponse:
-        payload = add_user_id(data, user_id)
-        return self.client.post(f"{self.url}/unread", data=payload)
+        payload = add_user_id_inplace(data, user_id)
+        return self.client.post(self._path("unread"), data=payload)
 
     def get_replies(self, parent_id: str, **options: Any) -> StreamResponse:
         return self.client.get(f"messages/{parent_id}/replies", params=options)
@@ -157,14 +186,14 @@ class Channel(ChannelInterface):
         )
 
     def accept_invite(self, user_id: str, **data: Any) -> StreamResponse:
-        payload = add_user_id(data, user_id)
+        payload = add_user_id_inplace(data, user_id)
         payload["accept_invite"] = True
         response = self.client.post(self.url, data=payload)
         self.custom_data = response["channel"]
         return response
 
     def reject_invite(self, user_id: str, **data: Any) -> StreamResponse:
-        payload = add_user_id(data, user_id)
+        payload = add_user_id_inplace(data, user_id)
         payload["reject_invite"] = True
         response = self.client.post(self.url, data=payload)
         self.custom_data = response["channel"]
@@ -174,27 +203,27 @@ class Channel(ChannelInterface):
         self, url: str, name: str, user: Dict, content_type: str = None
     ) -> StreamResponse:
         return self.client.send_file(  # type: ignore
-            f"{self.url}/file", url, name, user, content_type=content_type
+            self._path("file"), url, name, user, content_type=content_type
         )
 
     def send_image(
         self, url: str, name: str, user: Dict, content_type: str = None
     ) -> StreamResponse:
         return self.client.send_file(  # type: ignore
-            f"{self.url}/image", url, name, user, content_type=content_type
+            self._path("image"), url, name, user, content_type=content_type
         )
 
     def delete_file(self, url: str) -> StreamResponse:
-        return self.client.delete(f"{self.url}/file", {"url": url})
+        return self.client.delete(self._path("file"), {"url": url})
 
     def delete_image(self, url: str) -> StreamResponse:
-        return self.client.delete(f"{self.url}/image", {"url": url})
+        return self.client.delete(self._path("image"), {"url": url})
 
     def hide(self, user_id: str) -> StreamResponse:
-        return self.client.post(f"{self.url}/hide", data={"user_id": user_id})
+        return self.client.post(self._path("hide"), data={"user_id": user_id})
 
     def show(self, user_id: str) -> StreamResponse:
-        return self.client.post(f"{self.url}/show", data={"user_id": user_id})
+        return self.client.post(self._path("show"), data={"user_id": user_id})
 
     def mute(self, user_id: str, expiration: int = None) -> StreamResponse:
         params: Dict[str, Union[str, int]] = {
@@ -246,5 +275,264 @@ class Channel(ChannelInterface):
         if not user_id:
             raise StreamChannelException("user_id must not be empty")
 
-        payload = {"set": to_set or {}, "unset": to_unset or []}
+        payload = {"set": to_set or {}, "unset": normalize_unset(to_unset)}
         return self.client.patch(f"{self.url}/member/{user_id}", data=payload)
+
+
+class CachedChannel(ReadCacheMixin[StreamResponse, List[StreamResponse]], Channel):
+    """
+    A channel that memoizes its read-only requests for `read_cache_ttl` seconds.
+    See `ReadCacheMixin` for the consistency trade-offs.
+
+    ::
+
+        channel = CachedChannel(client, "messaging", "general", read_cache_ttl=2.0)
+    """
+
+    # writes clear the read cache once they complete, reads made meanwhile included
+    def send_message(
+        self, message: Dict, user_id: str, **options: Any
+    ) -> StreamResponse:
+        try:
+            return super().send_message(message, user_id, **options)
+        finally:
+            self.clear_read_cache()
+
+    def send_event(self, event: Dict, user_id: str) -> StreamResponse:
+        try:
+            return super().send_event(event, user_id)
+        finally:
+            self.clear_read_cache()
+
+    def send_reaction(
+        self, message_id: str, reaction: Dict, user_id: str
+    ) -> StreamResponse:
+        try:
+            return super().send_reaction(message_id, reaction, user_id)
+        finally:
+            self.clear_read_cache()
+
+    def delete_reaction(
+        self, message_id: str, reaction_type: str, user_id: str
+    ) -> StreamResponse:
+        try:
+            return super().delete_reaction(message_id, reaction_type, user_id)
+        finally:
+            self.clear_read_cache()
+
+    def create(self, user_id: str, **options: Any) -> StreamResponse:
+        try:
+            return super().create(user_id, **options)
+        finally:
+            self.clear_read_cache()
+
+    def query(self, **options: Any) -> StreamResponse:
+        try:
+            return super().query(**options)
+        finally:
+            self.clear_read_cache()
+
+    def update(self, channel_data: Dict, update_message: Dict = None) -> StreamResponse:
+        try:
+            return super().update(channel_data, update_message)
+        finally:
+            self.clear_read_cache()
+
+    def update_partial(
+        self, to_set: Dict = None, to_unset: Iterable[str] = None
+    ) -> StreamResponse:
+        try:
+            return super().update_partial(to_set, to_unset)
+        finally:
+            self.clear_read_cache()
+
+    def delete(self) -> StreamResponse:
+        try:
+            return super().delete()
+        finally:
+            self.clear_read_cache()
+
+    def truncate(self, **options: Any) -> StreamResponse:
+        try:
+            return super().truncate(**options)
+        finally:
+            self.clear_read_cache()
+
+    def add_members(
+        self,
+        members: Union[Iterable[Dict], Iterable[str]],
+        message: Dict = None,
+        **options: Any,
+    ) -> StreamResponse:
+        try:
+            return super().add_members(members, message, **options)
+        finally:
+            self.clear_read_cache()
+
+    def assign_roles(
+        self, members: Iterable[Dict], message: Dict = None
+    ) -> StreamResponse:
+        try:
+            return super().assign_roles(members, message)
+        finally:
+            self.clear_read_cache()
+
+    def invite_members(
+        self, user_ids: Iterable[str], message: Dict = None
+    ) -> StreamResponse:
+        try:
+            return super().invite_members(user_ids, message)
+        finally:
+            self.clear_read_cache()
+
+    def add_moderators(
+        self, user_ids: Iterable[str], message: Dict = None
+    ) -> StreamResponse:
+        try:
+            return super().add_moderators(user_ids, message)
+        finally:
+            self.clear_read_cache()
+
+    def remove_members(
+        self, user_ids: Iterable[str], message: Dict = None
+    ) -> StreamResponse:
+        try:
+            return super().remove_members(user_ids, message)
+        finally:
+            self.clear_read_cache()
+
+    def demote_moderators(
+        self, user_ids: Iterable[str], message: Dict = None
+    ) -> StreamResponse:
+        try:
+            return super().demote_moderators(user_ids, message)
+        finally:
+            self.clear_read_cache()
+
+    def update_members(
+        self, changes: Iterable[Dict], message: Dict = None
+    ) -> StreamResponse:
+        try:
+            return super().update_members(changes, message)
+        finally:
+            self.clear_read_cache()
+
+    def mark_read(self, user_id: str, **data: Any) -> StreamResponse:
+        try:
+            return super().mark_read(user_id, **data)
+        finally:
+            self.clear_read_cache()
+
+    def mark_unread(self, user_id: str, **data: Any) -> StreamResponse:
+        try:
+            return super().mark_unread(user_id, **data)
+        finally:
+            self.clear_read_cache()
+
+    def ban_user(self, target_id: str, **options: Any) -> StreamResponse:
+        try:
+            return super().ban_user(target_id, **options)
+        finally:
+            self.clear_read_cache()
+
+    def unban_user(self, target_id: str, **options: Any) -> StreamResponse:
+        try:
+            return super().unban_user(target_id, **options)
+        finally:
+            self.clear_read_cache()
+
+    def accept_invite(self, user_id: str, **data: Any) -> StreamResponse:
+        try:
+            return super().accept_invite(user_id, **data)
+        finally:
+            self.clear_read_cache()
+
+    def reject_invite(self, user_id: str, **data: Any) -> StreamResponse:
+        try:
+            return super().reject_invite(user_id, **data)
+        finally:
+            self.clear_read_cache()
+
+    def send_file(
+        self, url: str, name: str, user: Dict, content_type: str = None
+    ) -> StreamResponse:
+        try:
+            return super().send_file(url, name, user, content_type)
+        finally:
+            self.clear_read_cache()
+
+    def send_image(
+        self, url: str, name: str, user: Dict, content_type: str = None
+    ) -> StreamResponse:
+        try:
+            return super().send_image(url, name, user, content_type)
+        finally:
+            self.clear_read_cache()
+
+    def delete_file(self, url: str) -> StreamResponse:
+        try:
+            return super().delete_file(url)
+        finally:
+            self.clear_read_cache()
+
+    def delete_image(self, url: str) -> StreamResponse:
+        try:
+            return super().delete_image(url)
+        finally:
+            self.clear_read_cache()
+
+    def hide(self, user_id: str) -> StreamResponse:
+        try:
+            return super().hide(user_id)
+        finally:
+            self.clear_read_cache()
+
+    def show(self, user_id: str) -> StreamResponse:
+        try:
+            return super().show(user_id)
+        finally:
+            self.clear_read_cache()
+
+    def mute(self, user_id: str, expiration: int = None) -> StreamResponse:
+        try:
+            return super().mute(user_id, expiration)
+        finally:
+            self.clear_read_cache()
+
+    def unmute(self, user_id: str) -> StreamResponse:
+        try:
+            return super().unmute(user_id)
+        finally:
+            self.clear_read_cache()
+
+    def pin(self, user_id: str) -> StreamResponse:
+        try:
+            return super().pin(user_id)
+        finally:
+            self.clear_read_cache()
+
+    def unpin(self, user_id: str) -> StreamResponse:
+        try:
+            return super().unpin(user_id)
+        finally:
+            self.clear_read_cache()
+
+    def archive(self, user_id: str) -> StreamResponse:
+        try:
+            return super().archive(user_id)
+        finally:
+            self.clear_read_cache()
+
+    def unarchive(self, user_id: str) -> StreamResponse:
+        try:
+            return super().unarchive(user_id)
+        finally:
+            self.clear_read_cache()
+
+    def update_member_partial(
+        self, user_id: str, to_set: Dict = None, to_unset: Iterable[str] = None
+    ) -> StreamResponse:
+        try:
+            return super().update_member_partial(user_id, to_set, to_unset)
+        finally:
+            self.clear_read_cache()
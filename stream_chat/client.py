@@ -51,9 +51,16 @@ class StreamChat(StreamChatInterface):
         super().__init__(
             api_key=api_key, api_secret=api_secret, timeout=timeout, **options
         )
+        pool_maxsize = options.get("pool_maxsize", requests.adapters.DEFAULT_POOLSIZE)
         self.session = requests.Session()
-        self.session.mount("http://", requests.adapters.HTTPAdapter(max_retries=1))
-        self.session.mount("https://", requests.adapters.HTTPAdapter(max_retries=1))
+        self.session.mount(
+            "http://",
+            requests.adapters.HTTPAdapter(max_retries=1, pool_maxsize=pool_maxsize),
+        )
+        self.session.mount(
+            "https://",
+            requests.adapters.HTTPAdapter(max_retries=1, pool_maxsize=pool_maxsize),
+        )
 
     def set_http_session(self, session: requests.Session) -> None:
         """
@@ -62,6 +69,15 @@ class StreamChat(StreamChatInterface):
         """
         self.session = session
 
+    def warm(self, relative_url: str = "") -> None:
+        try:
+            self.session.options(
+                f"{self.base_url}/{relative_url}", timeout=self.timeout
+            )
+        except requests.RequestException:
+            # the next real request reconnects and reports the error
+            pass
+
     def _parse_response(self, response: requests.Response) -> StreamResponse:
         try:
             parsed_result = json.loads(response.text) if response.text else {}
@@ -81,11 +97,9 @@ class StreamChat(StreamChatInterface):
         params: Dict = None,
         data: Any = None,
     ) -> StreamResponse:
-        params = params or {}
         data = data or {}
         serialized = None
-        default_params = self.get_default_params()
-        default_params.update(params)
+        default_params = self.build_params(params)
         headers = get_default_header()
         headers["Authorization"] = self.auth_token
         headers["stream-auth-type"] = "jwt"
@@ -472,7 +486,7 @@ class StreamChat(StreamChatInterface):
             ).read()
         response = requests.post(
             f"{self.base_url}/{uri}",
-            params=self.get_default_params(),
+            params=self._default_params,
             data={"user": json.dumps(user)},
             files={"file": (name, content, content_type)},  # type: ignore
             headers=headers,
@@ -700,11 +714,9 @@ class StreamChat(StreamChatInterface):
         if isinstance(before, datetime.datetime):
             before = before.isoformat()
 
-        updates = []
-        for user_id in user_ids:
-            updates.append(
-                {"id": user_id, "set": {"revoke_tokens_issued_before": before}}
-            )
+        # every user gets the same field update, so one dict is shared by all entries
+        fields = {"revoke_tokens_issued_before": before}
+        updates = [{"id": user_id, "set": fields} for user_id in user_ids]
         return self.update_users_partial(updates)
 
     def export_channel(
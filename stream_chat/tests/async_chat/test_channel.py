@@ -1,13 +1,15 @@
+import asyncio
 import time
 import uuid
 from pathlib import Path
 from typing import Dict, List
+from unittest.mock import patch
 
 import pytest
 
-from stream_chat.async_chat.channel import Channel
+from stream_chat.async_chat.channel import BatchingChannel, CachedChannel, Channel
 from stream_chat.async_chat.client import StreamChatAsync
-from stream_chat.base.exceptions import StreamAPIException
+from stream_chat.base.exceptions import StreamAPIException, StreamChannelException
 
 
 @pytest.mark.incremental
@@ -35,6 +37,37 @@ class TestChannel:
         await channel.create(random_users[0]["id"])
         assert channel.id is not None
 
+    def test_url_and_cid(self, client: StreamChatAsync):
+        channel = client.channel("messaging")
+        with pytest.raises(StreamChannelException):
+            channel.url
+        with pytest.raises(StreamChannelException):
+            channel.cid
+
+        channel.id = "general"
+        assert channel.url == "channels/messaging/general"
+        assert channel.cid == "messaging:general"
+
+        channel.id = "random"
+        assert channel.url == "channels/messaging/random"
+        assert channel.cid == "messaging:random"
+
+        channel.id = 42
+        assert channel.id == "42"
+        assert channel.url == "channels/messaging/42"
+
+    async def test_single_item_is_not_a_sequence(self, client: StreamChatAsync):
+        channel = client.channel("messaging", "general")
+        with pytest.raises(TypeError):
+            await channel.add_moderators("jo")
+        with pytest.raises(TypeError):
+            await channel.add_members({"user_id": "jo"})
+        with pytest.raises(TypeError):
+            await channel.update_partial(to_unset="name")
+        with patch.object(client, "post") as post:
+            await channel.add_members(None)
+        assert post.call_args.kwargs["data"]["add_members"] is None
+
     async def test_create_with_options(
         self, client: StreamChatAsync, random_users: List[Dict]
     ):
@@ -53,6 +86,21 @@ class TestChannel:
         assert "message" in response
         assert response["message"]["text"] == "hi"
 
+    async def test_send_messages(self, channel: Channel, random_user: Dict):
+        responses = await channel.send_messages(
+            [{"text": "hi"}, {"text": "there"}], random_user["id"], skip_push=True
+        )
+        assert [r["message"]["text"] for r in responses] == ["hi", "there"]
+
+    async def test_send_events(self, channel: Channel, random_user: Dict):
+        responses = await channel.send_events(
+            [{"type": "typing.start"}, {"type": "typing.stop"}], random_user["id"]
+        )
+        assert [r["event"]["type"] for r in responses] == [
+            "typing.start",
+            "typing.stop",
+        ]
+
     async def test_send_event(self, channel: Channel, random_user: Dict):
         response = await channel.send_event({"type": "typing.start"}, random_user["id"])
         assert "event" in response
@@ -67,6 +115,28 @@ class TestChannel:
         assert len(response["message"]["latest_reactions"]) == 1
         assert response["message"]["latest_reactions"][0]["type"] == "love"
 
+    async def test_batch(self, channel: Channel, random_user: Dict):
+        msg = await channel.send_message({"text": "hi"}, random_user["id"])
+        responses = await channel.batch(
+            [
+                {
+                    "method": "send_reaction",
+                    "args": {
+                        "message_id": msg["message"]["id"],
+                        "reaction": {"type": "love"},
+                        "user_id": random_user["id"],
+                    },
+                },
+                {"method": "mark_read", "args": {"user_id": random_user["id"]}},
+            ]
+        )
+        assert len(responses) == 2
+        assert responses[0]["reaction"]["type"] == "love"
+        assert "event" in responses[1]
+
+        with pytest.raises(StreamChannelException):
+            await channel.batch([{"method": "batch"}])
+
     async def test_delete_reaction(self, channel: Channel, random_user: Dict):
         msg = await channel.send_message({"text": "hi"}, random_user["id"])
         await channel.send_reaction(
@@ -145,6 +215,23 @@ class TestChannel:
         response = await channel.demote_moderators([random_user["id"]])
         assert not response["members"][0].get("is_moderator", False)
 
+    async def test_update_members(self, channel: Channel, random_users: List[Dict]):
+        response = await channel.update_members(
+            [
+                {"op": "add", "user_id": random_users[0]["id"]},
+                {"op": "add", "user_id": random_users[1]["id"]},
+                {"op": "promote", "user_id": random_users[1]["id"]},
+            ]
+        )
+        members = {m["user_id"]: m for m in response["members"]}
+        assert random_users[0]["id"] in members
+        assert members[random_users[1]["id"]]["is_moderator"]
+
+        with pytest.raises(StreamChannelException):
+            await channel.update_members(
+                [{"op": "ban", "user_id": random_users[0]["id"]}]
+            )
+
     async def test_assign_roles_moderators(self, channel: Channel, random_user: Dict):
         member = {"user_id": random_user["id"], "channel_role": "channel_moderator"}
         response = await channel.add_members([member])
@@ -169,6 +256,48 @@ class TestChannel:
         assert "event" in response
         assert response["event"]["type"] == "message.read"
 
+    async def test_batching_channel(
+        self, client: StreamChatAsync, channel: Channel, random_user: Dict
+    ):
+        batching = BatchingChannel(client, channel.channel_type, channel.id)
+        responses = await asyncio.gather(
+            batching.mark_read(random_user["id"]),
+            batching.mark_read(random_user["id"]),
+            batching.send_event({"type": "typing.start"}, random_user["id"]),
+        )
+        assert responses[0] is responses[1]
+        assert "event" in responses[0]
+        assert responses[2]["event"]["type"] == "typing.start"
+
+        pending = asyncio.ensure_future(batching.mark_read(random_user["id"]))
+        await asyncio.sleep(0)
+        await batching.flush()
+        assert pending.done()
+
+        responses = await asyncio.gather(
+            batching.send_event({"type": "custom", "n": 1}, random_user["id"]),
+            batching.send_event({"type": "custom", "n": 2}, random_user["id"]),
+        )
+        assert [r["event"]["n"] for r in responses] == [1, 2]
+
+    async def test_batching_channel_keeps_distinct_reads(self, client: StreamChatAsync):
+        batching = BatchingChannel(client, "messaging", "general")
+        posts = []
+
+        async def post(path, data=None):
+            posts.append(data)
+            return {"n": len(posts)}
+
+        with patch.object(client, "post", side_effect=post):
+            old, new, repeated = await asyncio.gather(
+                batching.mark_read("jo", message_id="old"),
+                batching.mark_read("jo", message_id="new"),
+                batching.mark_read("jo", message_id="new"),
+            )
+        assert sorted(p["message_id"] for p in posts) == ["new", "old"]
+        assert new is repeated
+        assert old is not new
+
     async def test_mark_unread(self, channel: Channel, random_user: Dict):
         msg = await channel.send_message({"text": "hi"}, random_user["id"])
         response = await channel.mark_unread(
@@ -197,6 +326,17 @@ class TestChannel:
         assert len(response["messages"]) == 3
         assert response["messages"][0]["index"] == 7
 
+    async def test_gather(self, channel: Channel, random_user: Dict):
+        messages = [
+            await channel.send_message({"text": f"hi {i}"}, random_user["id"])
+            for i in range(3)
+        ]
+        responses = await channel.gather(
+            *[channel.get_reactions(m["message"]["id"]) for m in messages], limit=2
+        )
+        assert len(responses) == 3
+        assert all("reactions" in r for r in responses)
+
     async def test_get_reactions(self, channel: Channel, random_user: Dict):
         msg = await channel.send_message({"text": "hi"}, random_user["id"])
         response = await channel.get_reactions(msg["message"]["id"])
@@ -220,6 +360,47 @@ class TestChannel:
 
         assert response["reactions"][0]["count"] == 42
 
+    async def test_cached_channel(
+        self, client: StreamChatAsync, channel: Channel, random_user: Dict
+    ):
+        cached = CachedChannel(client, channel.channel_type, channel.id)
+        msg = await cached.send_message({"text": "hi"}, random_user["id"])
+        first = await cached.get_reactions(msg["message"]["id"])
+        assert await cached.get_reactions(msg["message"]["id"]) is first
+        assert len(first["reactions"]) == 0
+
+        await cached.send_reaction(
+            msg["message"]["id"], {"type": "love"}, random_user["id"]
+        )
+        response = await cached.get_reactions(msg["message"]["id"])
+        assert len(response["reactions"]) == 1
+
+        cancelled = asyncio.ensure_future(cached.get_reactions(msg["message"]["id"]))
+        shared = asyncio.ensure_future(cached.get_reactions(msg["message"]["id"]))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        response = await shared
+        assert len(response["reactions"]) == 1
+
+    async def test_cached_channel_read_during_write(self, client: StreamChatAsync):
+        cached = CachedChannel(client, "messaging", "general")
+        reads = []
+
+        async def get(path, params=None):
+            reads.append(path)
+            return {"n": len(reads)}
+
+        async def post(path, data=None):
+            # a read served while the write is in flight may see the old state
+            assert (await cached.get_reactions("m"))["n"] == 1
+            return {}
+
+        with patch.object(client, "get", side_effect=get), patch.object(
+            client, "post", side_effect=post
+        ):
+            await cached.send_reaction("m", {"type": "love"}, "jo")
+            assert (await cached.get_reactions("m"))["n"] == 2
+
     async def test_send_and_delete_file(self, channel: Channel, random_user: Dict):
         url = str(
             Path.joinpath(Path(__file__).parent.parent, "assets", "helloworld.jpg")
@@ -310,6 +491,17 @@ class TestChannel:
         # can reject again, noop
         await channel.reject_invite("eric")
 
+    async def test_query_many(
+        self, client: StreamChatAsync, channel: Channel, random_user: Dict
+    ):
+        other = client.channel("messaging", str(uuid.uuid4()))
+        await other.create(random_user["id"])
+        try:
+            responses = await Channel.query_many([channel, other], limit=2, watch=False)
+            assert [r["channel"]["id"] for r in responses] == [channel.id, other.id]
+        finally:
+            await other.delete()
+
     async def test_query_members(self, client: StreamChatAsync, channel: Channel):
         members = ["paul", "george", "john", "jessica", "john2"]
         await client.upsert_users([{"id": m, "name": m} for m in members])
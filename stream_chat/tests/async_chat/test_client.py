@@ -1,12 +1,16 @@
+import hashlib
+import hmac
 import json
 import os
 import sys
 import time
 import uuid
+import warnings
 from contextlib import suppress
 from datetime import datetime
 from operator import itemgetter
 from typing import Dict, List
+from unittest.mock import patch
 
 import aiohttp
 import jwt
@@ -40,6 +44,20 @@ class TestClient:
             # Compare elements regardless of the order
             assert sorted(actual, key=itemgetter("field")) == expected
 
+    def test_client_attributes_can_be_patched(self, client: StreamChatAsync):
+        with patch.object(client, "post") as post:
+            assert client.post is post
+        client.custom_attribute = "value"
+        assert client.custom_attribute == "value"
+        del client.custom_attribute
+
+    def test_build_params(self, client: StreamChatAsync):
+        params = client.build_params({"limit": 10})
+        assert params == {"api_key": client.api_key, "limit": 10}
+        params["offset"] = 5
+        assert client.build_params() == {"api_key": client.api_key}
+        assert client.build_params() is not client.build_params()
+
     async def test_mute_user(self, client: StreamChatAsync, random_users: List[Dict]):
         response = await client.mute_user(random_users[0]["id"], random_users[1]["id"])
         assert "mute" in response
@@ -96,6 +114,25 @@ class TestClient:
             with pytest.raises(StreamAPIException):
                 await client.get_channel_type("team")
 
+    async def test_unclosed_client_warns(self):
+        client = StreamChatAsync(api_key="key", api_secret="secret")
+        with pytest.warns(ResourceWarning):
+            client.__del__()
+        await client.close()
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", ResourceWarning)
+            client.__del__()
+
+    async def test_client_with_own_session_does_not_warn(self):
+        client = StreamChatAsync(api_key="key", api_secret="secret")
+        await client.close()
+        async with aiohttp.ClientSession(base_url=client.base_url) as session:
+            client.set_http_session(session)
+            with warnings.catch_warnings():
+                warnings.simplefilter("error", ResourceWarning)
+                client.__del__()
+
     async def test_get_channel_types(self, client: StreamChatAsync):
         response = await client.get_channel_type("team")
         assert "permissions" in response
@@ -124,11 +161,118 @@ class TestClient:
         response = await client.list_commands()
         assert "commands" in response
 
+    def test_verify_webhook(self, client: StreamChatAsync):
+        body = b'{"type": "message.new"}'
+        signature = hmac.new(
+            client.api_secret.encode(), body, hashlib.sha256
+        ).hexdigest()
+        assert client.verify_webhook(body, signature)
+        assert client.verify_webhook(body, signature.encode())
+        assert client.verify_webhook(bytearray(body), signature)
+        assert client.verify_webhook(memoryview(b"xx" + body)[2:], signature)
+        assert not client.verify_webhook(body, "0" * len(signature))
+        assert not client.verify_webhook(b"{}", signature)
+        assert not client.verify_webhook(body, "é")
+        assert not client.verify_webhook(body, b"\xff")
+        assert not client.verify_webhook(body, None)
+        assert not client.verify_webhook(body, "")
+        assert not client.verify_webhook(body, signature.upper())
+
+    def test_verify_webhooks(self, client):
+        body = b'{"type": "message.new"}'
+        signature = hmac.new(
+            client.api_secret.encode(), body, hashlib.sha256
+        ).hexdigest()
+        events = [
+            (body, signature),
+            (body, signature.encode()),
+            (b"{}", signature),
+            (body, "0" * len(signature)),
+            (body, "é"),
+            (body, None),
+            (body, signature.upper()),
+        ]
+        assert client.verify_webhooks(events) == [
+            True,
+            True,
+            False,
+            False,
+            False,
+            False,
+            False,
+        ]
+        assert client.verify_webhooks([]) == []
+
+    async def test_server_token_is_shared(self, client: StreamChatAsync):
+        async with StreamChatAsync(
+            api_key=client.api_key, api_secret=client.api_secret
+        ) as other:
+            assert other.auth_token is client.auth_token
+            payload = jwt.decode(
+                other.auth_token, client.api_secret, algorithms=["HS256"]
+            )
+            assert payload == {"server": True}
+
     def test_create_token(self, client):
         token = client.create_token("tommaso")
         assert type(token) is str
         payload = jwt.decode(token, client.api_secret, algorithms=["HS256"])
         assert payload.get("user_id") == "tommaso"
+        assert client.create_token("tommaso") == token
+        assert token == jwt.encode(
+            {"user_id": "tommaso"}, client.api_secret, algorithm="HS256"
+        )
+
+        token = client.create_token("tommaso", admin=1)
+        assert jwt.decode(token, client.api_secret, algorithms=["HS256"])["admin"] == 1
+        token = client.create_token("tommaso", admin=True)
+        assert (
+            jwt.decode(token, client.api_secret, algorithms=["HS256"])["admin"] is True
+        )
+
+        token = client.create_token("tommaso", iat=0)
+        payload = jwt.decode(token, client.api_secret, algorithms=["HS256"])
+        assert payload.get("iat") == 0
+
+        token = client.create_token("tommaso", teams=["blue", "red"])
+        payload = jwt.decode(token, client.api_secret, algorithms=["HS256"])
+        assert payload.get("teams") == ["blue", "red"]
+        assert token == jwt.encode(
+            {"teams": ["blue", "red"], "user_id": "tommaso"},
+            client.api_secret,
+            algorithm="HS256",
+        )
+
+    def test_create_tokens(self, client):
+        user_ids = ["tommaso", "thierry", "tommaso"]
+        tokens = client.create_tokens(user_ids, exp=2000000000, teams=["blue"])
+        assert tokens == [
+            client.create_token(user_id, exp=2000000000, teams=["blue"])
+            for user_id in user_ids
+        ]
+        payload = jwt.decode(tokens[1], client.api_secret, algorithms=["HS256"])
+        assert payload == {"teams": ["blue"], "user_id": "thierry", "exp": 2000000000}
+        assert client.create_tokens([]) == []
+
+    async def test_pool_maxsize(self, client: StreamChatAsync):
+        async with StreamChatAsync(
+            api_key=client.api_key, api_secret=client.api_secret, pool_maxsize=50
+        ) as pooled:
+            assert pooled.session.connector.limit == 50
+
+    async def test_warm(self, client: StreamChatAsync):
+        await client.warm()
+        await client.channel("messaging", str(uuid.uuid4())).prepare()
+        configs = await client.get_app_settings()
+        assert "app" in configs
+
+    async def test_warm_ignores_connection_errors(self, client: StreamChatAsync):
+        async with StreamChatAsync(
+            api_key=client.api_key,
+            api_secret=client.api_secret,
+            base_url="http://127.0.0.1:1",
+        ) as unreachable:
+            await unreachable.warm()
 
     async def test_get_app_settings(self, client: StreamChatAsync):
         configs = await client.get_app_settings()
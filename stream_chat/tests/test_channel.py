@@ -2,12 +2,14 @@ import time
 import uuid
 from pathlib import Path
 from typing import Dict, List
+from unittest.mock import patch
 
 import pytest
 
 from stream_chat import StreamChat
-from stream_chat.base.exceptions import StreamAPIException
-from stream_chat.channel import Channel
+from stream_chat.base.channel import ChannelInterface
+from stream_chat.base.exceptions import StreamAPIException, StreamChannelException
+from stream_chat.channel import CachedChannel, Channel
 
 
 @pytest.mark.incremental
@@ -31,6 +33,53 @@ class TestChannel:
         channel.create(random_users[0]["id"])
         assert channel.id is not None
 
+    def test_url_and_cid(self, client: StreamChat):
+        channel = client.channel("messaging")
+        with pytest.raises(StreamChannelException):
+            channel.url
+        with pytest.raises(StreamChannelException):
+            channel.cid
+
+        channel.id = "general"
+        assert channel.url == "channels/messaging/general"
+        assert channel.cid == "messaging:general"
+
+        channel.id = "random"
+        assert channel.url == "channels/messaging/random"
+        assert channel.cid == "messaging:random"
+
+        channel.id = 42
+        assert channel.id == "42"
+        assert channel.url == "channels/messaging/42"
+
+    def test_single_item_is_not_a_sequence(self, client: StreamChat):
+        channel = client.channel("messaging", "general")
+        with pytest.raises(TypeError):
+            channel.add_moderators("jo")
+        with pytest.raises(TypeError):
+            channel.add_members({"user_id": "jo"})
+        with pytest.raises(TypeError):
+            channel.update_partial(to_unset="name")
+        with patch.object(client, "post") as post:
+            channel.add_members(None)
+        assert post.call_args.kwargs["data"]["add_members"] is None
+
+    def test_subclass_without_the_newer_methods(self, client: StreamChat):
+        abstract = ChannelInterface.__abstractmethods__
+        legacy = type(
+            "LegacyChannel",
+            (ChannelInterface,),
+            {name: lambda *args, **kwargs: None for name in abstract},
+        )
+        channel = legacy(client, "messaging", "general")
+        with patch.object(client, "post") as post:
+            channel.update_members([{"op": "add", "user_id": "jo"}])
+        post.assert_called_once_with(
+            channel.url, data={"message": None, "add_members": ["jo"]}
+        )
+        with pytest.raises(NotImplementedError):
+            channel.batch([])
+
     def test_create_with_options(self, client: StreamChat, random_users: List[Dict]):
         channel = client.channel(
             "messaging", data={"members": [u["id"] for u in random_users]}
@@ -63,6 +112,21 @@ class TestChannel:
         assert "message" in response
         assert response["message"]["text"] == "hi"
 
+    def test_send_messages(self, channel: Channel, random_user: Dict):
+        responses = channel.send_messages(
+            [{"text": "hi"}, {"text": "there"}], random_user["id"], skip_push=True
+        )
+        assert [r["message"]["text"] for r in responses] == ["hi", "there"]
+
+    def test_send_events(self, channel: Channel, random_user: Dict):
+        responses = channel.send_events(
+            [{"type": "typing.start"}, {"type": "typing.stop"}], random_user["id"]
+        )
+        assert [r["event"]["type"] for r in responses] == [
+            "typing.start",
+            "typing.stop",
+        ]
+
     def test_send_event(self, channel: Channel, random_user: Dict):
         response = channel.send_event({"type": "typing.start"}, random_user["id"])
         assert "event" in response
@@ -77,6 +141,28 @@ class TestChannel:
         assert len(response["message"]["latest_reactions"]) == 1
         assert response["message"]["latest_reactions"][0]["type"] == "love"
 
+    def test_batch(self, channel: Channel, random_user: Dict):
+        msg = channel.send_message({"text": "hi"}, random_user["id"])
+        responses = channel.batch(
+            [
+                {
+                    "method": "send_reaction",
+                    "args": {
+                        "message_id": msg["message"]["id"],
+                        "reaction": {"type": "love"},
+                        "user_id": random_user["id"],
+                    },
+                },
+                {"method": "mark_read", "args": {"user_id": random_user["id"]}},
+            ]
+        )
+        assert len(responses) == 2
+        assert responses[0]["reaction"]["type"] == "love"
+        assert "event" in responses[1]
+
+        with pytest.raises(StreamChannelException):
+            channel.batch([{"method": "batch"}])
+
     def test_delete_reaction(self, channel: Channel, random_user: Dict):
         msg = channel.send_message({"text": "hi"}, random_user["id"])
         channel.send_reaction(msg["message"]["id"], {"type": "love"}, random_user["id"])
@@ -153,6 +239,21 @@ class TestChannel:
         response = channel.demote_moderators([random_user["id"]])
         assert not response["members"][0].get("is_moderator", False)
 
+    def test_update_members(self, channel: Channel, random_users: List[Dict]):
+        response = channel.update_members(
+            [
+                {"op": "add", "user_id": random_users[0]["id"]},
+                {"op": "add", "user_id": random_users[1]["id"]},
+                {"op": "promote", "user_id": random_users[1]["id"]},
+            ]
+        )
+        members = {m["user_id"]: m for m in response["members"]}
+        assert random_users[0]["id"] in members
+        assert members[random_users[1]["id"]]["is_moderator"]
+
+        with pytest.raises(StreamChannelException):
+            channel.update_members([{"op": "ban", "user_id": random_users[0]["id"]}])
+
     def test_assign_roles_moderators(self, channel: Channel, random_user: Dict):
         member = {"user_id": random_user["id"], "channel_role": "channel_moderator"}
         response = channel.add_members([member])
@@ -223,6 +324,38 @@ class TestChannel:
 
         assert response["reactions"][0]["count"] == 42
 
+    def test_cached_channel(
+        self, client: StreamChat, channel: Channel, random_user: Dict
+    ):
+        cached = CachedChannel(client, channel.channel_type, channel.id)
+        msg = cached.send_message({"text": "hi"}, random_user["id"])
+        first = cached.get_reactions(msg["message"]["id"])
+        assert cached.get_reactions(msg["message"]["id"]) is first
+        assert len(first["reactions"]) == 0
+
+        cached.send_reaction(msg["message"]["id"], {"type": "love"}, random_user["id"])
+        response = cached.get_reactions(msg["message"]["id"])
+        assert len(response["reactions"]) == 1
+
+    def test_cached_channel_read_during_write(self, client: StreamChat):
+        cached = CachedChannel(client, "messaging", "general")
+        reads = []
+
+        def get(path, params=None):
+            reads.append(path)
+            return {"n": len(reads)}
+
+        def post(path, data=None):
+            # a read served while the write is in flight may see the old state
+            assert cached.get_reactions("m")["n"] == 1
+            return {}
+
+        with patch.object(client, "get", side_effect=get), patch.object(
+            client, "post", side_effect=post
+        ):
+            cached.send_reaction("m", {"type": "love"}, "jo")
+            assert cached.get_reactions("m")["n"] == 2
+
     def test_send_and_delete_file(self, channel: Channel, random_user: Dict):
         url = str(Path.joinpath(Path(__file__).parent, "assets", "helloworld.jpg"))
         resp = channel.send_file(url, "helloworld.jpg", random_user)
@@ -309,6 +442,15 @@ class TestChannel:
         # cannot reject again, noop
         channel.reject_invite("eric")
 
+    def test_query_many(self, client: StreamChat, channel: Channel, random_user: Dict):
+        other = client.channel("messaging", str(uuid.uuid4()))
+        other.create(random_user["id"])
+        try:
+            responses = Channel.query_many([channel, other], limit=2, watch=False)
+            assert [r["channel"]["id"] for r in responses] == [channel.id, other.id]
+        finally:
+            other.delete()
+
     def test_query_members(self, client: StreamChat, channel: Channel):
         members = ["paul", "george", "john", "jessica", "john2"]
         client.upsert_users([{"id": m, "name": m} for m in members])
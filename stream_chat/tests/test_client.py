@@ -1,3 +1,5 @@
+import hashlib
+import hmac
 import json
 import os
 import sys
@@ -7,6 +9,7 @@ from contextlib import suppress
 from datetime import datetime
 from operator import itemgetter
 from typing import Dict, List
+from unittest.mock import patch
 
 import jwt
 import pytest
@@ -40,6 +43,20 @@ class TestClient:
             # Compare elements regardless of the order
             assert sorted(actual, key=itemgetter("field")) == expected
 
+    def test_client_attributes_can_be_patched(self, client: StreamChat):
+        with patch.object(client, "post") as post:
+            assert client.post is post
+        client.custom_attribute = "value"
+        assert client.custom_attribute == "value"
+        del client.custom_attribute
+
+    def test_build_params(self, client: StreamChat):
+        params = client.build_params({"limit": 10})
+        assert params == {"api_key": client.api_key, "limit": 10}
+        params["offset"] = 5
+        assert client.build_params() == {"api_key": client.api_key}
+        assert client.build_params() is not client.build_params()
+
     def test_mute_user(self, client: StreamChat, random_users: List[Dict]):
         response = client.mute_user(random_users[0]["id"], random_users[1]["id"])
         assert "mute" in response
@@ -116,11 +133,115 @@ class TestClient:
         response = client.list_commands()
         assert "commands" in response
 
+    def test_verify_webhook(self, client: StreamChat):
+        body = b'{"type": "message.new"}'
+        signature = hmac.new(
+            client.api_secret.encode(), body, hashlib.sha256
+        ).hexdigest()
+        assert client.verify_webhook(body, signature)
+        assert client.verify_webhook(body, signature.encode())
+        assert client.verify_webhook(bytearray(body), signature)
+        assert client.verify_webhook(memoryview(b"xx" + body)[2:], signature)
+        assert not client.verify_webhook(body, "0" * len(signature))
+        assert not client.verify_webhook(b"{}", signature)
+        assert not client.verify_webhook(body, "é")
+        assert not client.verify_webhook(body, b"\xff")
+        assert not client.verify_webhook(body, None)
+        assert not client.verify_webhook(body, "")
+        assert not client.verify_webhook(body, signature.upper())
+
+    def test_verify_webhooks(self, client):
+        body = b'{"type": "message.new"}'
+        signature = hmac.new(
+            client.api_secret.encode(), body, hashlib.sha256
+        ).hexdigest()
+        events = [
+            (body, signature),
+            (body, signature.encode()),
+            (b"{}", signature),
+            (body, "0" * len(signature)),
+            (body, "é"),
+            (body, None),
+            (body, signature.upper()),
+        ]
+        assert client.verify_webhooks(events) == [
+            True,
+            True,
+            False,
+            False,
+            False,
+            False,
+            False,
+        ]
+        assert client.verify_webhooks([]) == []
+
+    def test_server_token_is_shared(self, client: StreamChat):
+        other = StreamChat(api_key=client.api_key, api_secret=client.api_secret)
+        assert other.auth_token is client.auth_token
+        payload = jwt.decode(other.auth_token, client.api_secret, algorithms=["HS256"])
+        assert payload == {"server": True}
+
     def test_create_token(self, client: StreamChat):
         token = client.create_token("tommaso")
         assert type(token) is str
         payload = jwt.decode(token, client.api_secret, algorithms=["HS256"])
         assert payload.get("user_id") == "tommaso"
+        assert client.create_token("tommaso") == token
+        assert token == jwt.encode(
+            {"user_id": "tommaso"}, client.api_secret, algorithm="HS256"
+        )
+
+        token = client.create_token("tommaso", admin=1)
+        assert jwt.decode(token, client.api_secret, algorithms=["HS256"])["admin"] == 1
+        token = client.create_token("tommaso", admin=True)
+        assert (
+            jwt.decode(token, client.api_secret, algorithms=["HS256"])["admin"] is True
+        )
+
+        token = client.create_token("tommaso", iat=0)
+        payload = jwt.decode(token, client.api_secret, algorithms=["HS256"])
+        assert payload.get("iat") == 0
+
+        token = client.create_token("tommaso", teams=["blue", "red"])
+        payload = jwt.decode(token, client.api_secret, algorithms=["HS256"])
+        assert payload.get("teams") == ["blue", "red"]
+        assert token == jwt.encode(
+            {"teams": ["blue", "red"], "user_id": "tommaso"},
+            client.api_secret,
+            algorithm="HS256",
+        )
+
+    def test_create_tokens(self, client):
+        user_ids = ["tommaso", "thierry", "tommaso"]
+        tokens = client.create_tokens(user_ids, exp=2000000000, teams=["blue"])
+        assert tokens == [
+            client.create_token(user_id, exp=2000000000, teams=["blue"])
+            for user_id in user_ids
+        ]
+        payload = jwt.decode(tokens[1], client.api_secret, algorithms=["HS256"])
+        assert payload == {"teams": ["blue"], "user_id": "thierry", "exp": 2000000000}
+        assert client.create_tokens([]) == []
+
+    def test_pool_maxsize(self, client: StreamChat):
+        pooled = StreamChat(
+            api_key=client.api_key, api_secret=client.api_secret, pool_maxsize=50
+        )
+        adapter = pooled.session.get_adapter(pooled.base_url)
+        assert adapter._pool_maxsize == 50
+
+    def test_warm(self, client: StreamChat):
+        client.warm()
+        client.channel("messaging", str(uuid.uuid4())).prepare()
+        configs = client.get_app_settings()
+        assert "app" in configs
+
+    def test_warm_ignores_connection_errors(self, client: StreamChat):
+        unreachable = StreamChat(
+            api_key=client.api_key,
+            api_secret=client.api_secret,
+            base_url="http://127.0.0.1:1",
+        )
+        unreachable.warm()
 
     def test_get_app_settings(self, client: StreamChat):
         configs = client.get_app_settings()
@@ -0,0 +1,23 @@
+import pytest
+
+from stream_chat.base.exceptions import StreamAPIException
+
+
+class TestStreamAPIException:
+    def test_json_error(self):
+        error = StreamAPIException('{"code": 4, "message": "bad input"}', 400)
+        assert error.status_code == 400
+        assert error.json_response
+        assert error.error_code == 4
+        assert error.error_message == "bad input"
+        assert str(error) == 'StreamChat error code 4: bad input"'
+
+    def test_non_json_error(self):
+        for text in ("", "<html>502</html>", "[]", "{not json"):
+            error = StreamAPIException(text, 502)
+            assert error.response_text == text
+            assert not error.json_response
+            assert not hasattr(error, "error_code")
+            with pytest.raises(AttributeError):
+                error.error_message
+            assert str(error) == "StreamChat error HTTP code: 502"
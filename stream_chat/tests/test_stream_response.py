@@ -38,3 +38,10 @@ class TestResponse:
         assert response.rate_limit().limit == 0
         assert response.rate_limit().remaining == 0
         assert response.rate_limit().reset == datetime.fromtimestamp(0, timezone.utc)
+
+    def test_missing_rate_limit_headers(self):
+        response = StreamResponse({"duration": "1ms"}, {}, 200)
+        assert response.rate_limit() is None
+        assert response.rate_limit() is None
+        assert response["duration"] == "1ms"
+        assert response.is_ok()
@@ -30,20 +30,9 @@ class StreamResponse(dict):
     ) -> None:
         self.__headers = headers
         self.__status_code = status_code
+        # rate limit headers are only parsed if rate_limit() is called
         self.__rate_limit: Optional[RateLimitInfo] = None
-        limit, remaining, reset = (
-            headers.get("x-ratelimit-limit"),
-            headers.get("x-ratelimit-remaining"),
-            headers.get("x-ratelimit-reset"),
-        )
-        if limit and remaining and reset:
-            self.__rate_limit = RateLimitInfo(
-                limit=int(self._clean_header(limit)),
-                remaining=int(self._clean_header(remaining)),
-                reset=datetime.fromtimestamp(
-                    float(self._clean_header(reset)), timezone.utc
-                ),
-            )
+        self.__rate_limit_parsed = False
 
         super(StreamResponse, self).__init__(response_dict)
 
@@ -56,6 +45,22 @@ class StreamResponse(dict):
 
     def rate_limit(self) -> Optional[RateLimitInfo]:
         """Returns the ratelimit info of your API operation."""
+        if not self.__rate_limit_parsed:
+            self.__rate_limit_parsed = True
+            headers = self.__headers
+            limit, remaining, reset = (
+                headers.get("x-ratelimit-limit"),
+                headers.get("x-ratelimit-remaining"),
+                headers.get("x-ratelimit-reset"),
+            )
+            if limit and remaining and reset:
+                self.__rate_limit = RateLimitInfo(
+                    limit=int(self._clean_header(limit)),
+                    remaining=int(self._clean_header(remaining)),
+                    reset=datetime.fromtimestamp(
+                        float(self._clean_header(reset)), timezone.utc
+                    ),
+                )
         return self.__rate_limit
 
     def headers(self) -> Dict[str, Any]: